@@ -0,0 +1,174 @@
+"""
+Benchmark for saving scraped jobs to SQLite
+
+Writes synthetic jobs to a fresh on-disk database, one scrape cycle
+(listing page) at a time, and compares:
+- per-job: the per-job save_job() that save_jobs() replaced (existence check,
+           count, eviction, INSERT or UPDATE and a commit for every job),
+           kept below as legacy_save_job
+- bulk:    save_jobs() once per cycle (one upsert transaction)
+
+Each path saves all jobs twice: first as new jobs, then as known jobs
+seen again. MAX_JOBS_IN_DB eviction applies as in production.
+
+Usage: python benchmark_database.py [jobs] [jobs per cycle]
+"""
+import io
+import sys
+import time
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config.settings import MAX_JOBS_IN_DB
+from parsers.job import Job, JOB_COLUMNS
+from storage.database import WorkanaDatabase
+
+
+COUNTRIES = ["Brazil", "Argentina", "Mexico", "Spain", "Colombia"]
+SKILLS = ["Python", "JavaScript", "React", "SQL", "Web Scraping", "Django"]
+
+
+def build_job(i: int) -> Job:
+    """Build one synthetic job; every few jobs vary the optional fields"""
+    return Job(
+        id=f"synthetic-job-number-{i}",
+        title=f"Build a web scraper & dashboard #{i}",
+        url=f"https://www.workana.com/job/synthetic-job-number-{i}",
+        posted_date_relative=f"{i % 24 + 1} hours ago",
+        posted_date_timestamp=datetime.now() - timedelta(hours=i % 24 + 1),
+        bids_count=i % 40,
+        description="We need a developer to build a scraper and a small dashboard. " * 4,
+        budget="USD 250 - 500",
+        budget_min=250,
+        budget_max=500,
+        budget_type="fixed",
+        skills=SKILLS[:i % len(SKILLS) + 1],
+        is_max_project=i % 7 == 0,
+        is_featured=i % 11 == 0,
+        client_name=f"Client {i}" if i % 5 else None,
+        client_country=COUNTRIES[i % len(COUNTRIES)],
+        client_rating=round(3 + (i % 20) / 10, 1),
+        client_payment_verified=i % 2 == 0,
+        client_last_reply="2 days ago",
+    )
+
+
+def report(name: str, jobs: int, seconds: float):
+    print(f"{name:<16} {jobs / seconds:>10.0f} jobs/sec  ({seconds * 1000:.1f} ms for {jobs} jobs)")
+
+
+def stored_rows(db: WorkanaDatabase) -> list:
+    """Job columns of every stored job (timestamps written by the database are left out)"""
+    return [tuple(row) for row in db.conn.execute(f"SELECT {', '.join(JOB_COLUMNS)} FROM jobs ORDER BY id")]
+
+
+def legacy_save_job(db: WorkanaDatabase, job: Job) -> bool:
+    """
+    WorkanaDatabase.save_job before save_jobs existed (baseline).
+    Returns True if job is new, False if it already existed.
+    """
+    now = datetime.now()
+    is_new = not db.job_exists(job.id)
+    row = job.to_row()
+
+    if is_new:
+        # Check if we need to remove oldest job to maintain limit
+        cursor = db.conn.execute('SELECT COUNT(*) FROM jobs')
+        current_count = cursor.fetchone()[0]
+
+        if current_count >= MAX_JOBS_IN_DB:
+            # Remove the oldest job (by scraped_at)
+            cursor = db.conn.execute('''
+                SELECT id FROM jobs 
+                ORDER BY scraped_at ASC 
+                LIMIT 1
+            ''')
+            oldest_job = cursor.fetchone()
+            if oldest_job:
+                oldest_job_id = oldest_job[0]
+                db.conn.execute('DELETE FROM jobs WHERE id = ?', (oldest_job_id,))
+                print(f"🗑️  Removed oldest job (ID: {oldest_job_id}) to maintain database limit of {MAX_JOBS_IN_DB}")
+
+        # Insert new job
+        db.conn.execute(f'''
+            INSERT INTO jobs (
+                {', '.join(JOB_COLUMNS)},
+                scraped_at, first_seen_at, last_seen_at,
+                sent_to_slack, slack_sent_at,
+                exported_to_sheets, sheets_exported_at
+            ) VALUES ({', '.join('?' * (len(JOB_COLUMNS) + 7))})
+        ''', row + (now, now, now, 0, None, 0, None))
+    else:
+        # Update existing job
+        db.conn.execute('''
+            UPDATE jobs SET
+                title = :title,
+                description = :description,
+                bids_count = :bids_count,
+                budget = :budget,
+                budget_min = :budget_min,
+                budget_max = :budget_max,
+                budget_type = :budget_type,
+                skills = :skills,
+                client_rating = :client_rating,
+                client_payment_verified = :client_payment_verified,
+                client_last_reply = :client_last_reply,
+                scraped_at = :now,
+                last_seen_at = :now
+            WHERE id = :id
+        ''', dict(zip(JOB_COLUMNS, row), now=now))
+
+    db.conn.commit()
+    return is_new
+
+
+def bench_per_job(db: WorkanaDatabase, cycles: list, label: str) -> int:
+    """Old path: legacy_save_job per job"""
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):  # Eviction messages
+        new_count = sum(1 for jobs in cycles for job in jobs if legacy_save_job(db, job))
+    report(f"per-job {label}", sum(len(jobs) for jobs in cycles), time.perf_counter() - start)
+    return new_count
+
+
+def bench_bulk(db: WorkanaDatabase, cycles: list, label: str) -> int:
+    """Bulk path: one save_jobs call per cycle"""
+    start = time.perf_counter()
+    with redirect_stdout(io.StringIO()):  # Eviction messages
+        new_count = sum(len(db.save_jobs(jobs)) for jobs in cycles)
+    report(f"bulk {label}", sum(len(jobs) for jobs in cycles), time.perf_counter() - start)
+    return new_count
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 3000
+    cycle_size = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    jobs = [build_job(i) for i in range(count)]
+    cycles = [jobs[i:i + cycle_size] for i in range(0, count, cycle_size)]
+
+    print("=" * 60)
+    print(f"Database benchmark: {count} jobs in cycles of {cycle_size} (limit {MAX_JOBS_IN_DB})")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as directory:
+        per_job_db = WorkanaDatabase(str(Path(directory) / 'per_job.db'))
+        bulk_db = WorkanaDatabase(str(Path(directory) / 'bulk.db'))
+        print(f"SQLite profile: {bulk_db.describe_profile()}")
+
+        per_job_new = [bench_per_job(per_job_db, cycles, "insert"), bench_per_job(per_job_db, cycles, "again")]
+        bulk_new = [bench_bulk(bulk_db, cycles, "insert"), bench_bulk(bulk_db, cycles, "again")]
+
+        print(f"New jobs reported (per-job / bulk): {per_job_new} / {bulk_new}")
+        print(f"Stored jobs identical: {stored_rows(per_job_db) == stored_rows(bulk_db)}")
+
+        per_job_db.close()
+        bulk_db.close()
+
+
+if __name__ == "__main__":
+    main()
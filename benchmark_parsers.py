@@ -0,0 +1,169 @@
+"""
+Benchmark for job card extraction/parsing engines
+
+Builds a synthetic listing page with realistic job cards and compares:
+- html:    outerHTML of each card parsed with BeautifulSoup (one tree per card)
+- lxml:    whole listing parsed once with lxml and precompiled XPath
+- browser: fields extracted in-page by one JS function (needs Playwright Chromium)
+
+Usage: python benchmark_parsers.py [cards] [rounds]
+"""
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from config.selectors import SELECTORS
+from parsers.job_parser import parse_job_element_from_html
+from parsers.lxml_parser import parse_jobs_from_listing
+
+
+CARD_TEMPLATE = """
+<div class="project-item js-project{featured_class}">
+    <div class="project-header">
+        <h2 class="h3 project-title"><span><a href="/job/{slug}?ref=projects_1">{title}</a></span></h2>
+        {max_badge}
+    </div>
+    <div class="project-main-details">
+        <span class="date" title="{date}">Published: <span>{date}</span></span>
+        <span class="bids">Bids: {bids}</span>
+    </div>
+    <div class="html-desc project-details"><div><p>{description}</p></div></div>
+    <p class="budget h4"><span class="values"><span>{budget}</span></span></p>
+    <div class="skills"><div>{skills}</div></div>
+    {author}
+</div>
+"""
+
+AUTHOR_TEMPLATE = """
+    <div class="project-author">
+        <span class="author-info"><button type="button">{client}</button></span>
+        <span class="country"><span class="country-name"><a href="/freelancers/{country_slug}">{country}</a></span></span>
+        <span class="rating"><span class="profile-stars"><span class="stars-bg" title="{rating} of 5.00"></span></span></span>
+        {payment}
+        <span class="message-created">Last reply: <span>{last_reply}</span></span>
+    </div>
+"""
+
+DATES = ["Just now", "5 minutes ago", "Almost an hour ago", "3 hours ago", "Yesterday", "2 days ago"]
+BUDGETS = ["USD 50 - 100", "Over USD 45 / hour", "Less than USD 50", "USD 1,000 - 3,000", "USD 250"]
+COUNTRIES = ["Brazil", "Argentina", "Mexico", "Spain", "Colombia"]
+
+
+def build_card(i: int) -> str:
+    """Build one synthetic job card; every few cards vary the optional parts"""
+    skills = "".join(
+        f'<a class="skill label label-info" href="/jobs?skills={s}"><h3>{s}</h3></a>'
+        for s in ["Python", "Django", "JavaScript", "React"][: 1 + i % 4]
+    )
+    author = ""
+    if i % 7 != 6:
+        author = AUTHOR_TEMPLATE.format(
+            client=f"Client {i % 13}",
+            country=COUNTRIES[i % len(COUNTRIES)],
+            country_slug=COUNTRIES[i % len(COUNTRIES)].lower(),
+            rating=f"{(i % 6) * 0.9:.2f}",
+            payment='<span class="payment"><span class="payment-verified">Payment verified</span></span>' if i % 2 else "",
+            last_reply=f"{i % 5 + 1} hours ago",
+        )
+    return CARD_TEMPLATE.format(
+        featured_class=" project-item-featured" if i % 10 == 0 else "",
+        slug=f"synthetic-job-number-{i}",
+        title=f"Build a web scraper &amp; dashboard #{i}",
+        max_badge='<span class="label label-max">Max</span>' if i % 10 == 0 else "",
+        date=DATES[i % len(DATES)],
+        bids=i % 40,
+        description="Need an experienced developer to build an automation pipeline. " * (1 + i % 5),
+        budget=BUDGETS[i % len(BUDGETS)],
+        skills=skills,
+        author=author,
+    )
+
+
+def build_listing(cards: int) -> str:
+    """Build a listing page with the #projects container"""
+    body = "".join(build_card(i) for i in range(cards))
+    return f'<html><body><div id="projects">{body}</div></body></html>'
+
+
+def report(name: str, cards: int, seconds: float):
+    print(f"{name:<10} {cards / seconds:>10.0f} cards/sec  ({seconds * 1000:.1f} ms for {cards} cards)")
+
+
+def bench_html(card_htmls, rounds: int) -> list:
+    """Current path: BeautifulSoup per card"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        jobs = [parse_job_element_from_html(html) for html in card_htmls]
+    report("html", len(card_htmls) * rounds, time.perf_counter() - start)
+    return jobs
+
+
+def bench_lxml(listing: str, rounds: int, expected: list):
+    """Whole-page lxml parse with precompiled XPath"""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        jobs = parse_jobs_from_listing(listing)
+    report("lxml", len(expected) * rounds, time.perf_counter() - start)
+    print(f"lxml output identical to html: {strip_times(jobs) == strip_times(expected)}")
+
+
+def bench_browser(listing: str, rounds: int, expected: list):
+    """Browser paths: outerHTML + BeautifulSoup vs in-page field extraction"""
+    try:
+        from playwright.sync_api import sync_playwright
+        from parsers.browser_extractor import extract_job_records, parse_job_record
+    except ImportError as e:
+        print(f"Skipping browser benchmark: {e}")
+        return
+
+    try:
+        with sync_playwright() as playwright:
+            browser = playwright.chromium.launch(args=['--no-sandbox'])
+            page = browser.new_page()
+            page.set_content(listing)
+
+            start = time.perf_counter()
+            for _ in range(rounds):
+                htmls = page.eval_on_selector_all(SELECTORS['job_item'], "elements => elements.map(element => element.outerHTML)")
+                [parse_job_element_from_html(html) for html in htmls]
+            report("html+ipc", len(expected) * rounds, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            for _ in range(rounds):
+                jobs = [parse_job_record(record) for record in extract_job_records(page)]
+            report("browser", len(expected) * rounds, time.perf_counter() - start)
+
+            browser.close()
+    except Exception as e:
+        print(f"Skipping browser benchmark: {str(e).splitlines()[0]}")
+        return
+
+    print(f"browser output identical to html: {strip_times(jobs) == strip_times(expected)}")
+
+
+def strip_times(jobs: list) -> list:
+    """Drop posted_date_timestamp (depends on the clock) before comparing engines"""
+    return [{k: v for k, v in job.items() if k != 'posted_date_timestamp'} for job in jobs]
+
+
+def main():
+    cards = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+    listing = build_listing(cards)
+    card_htmls = [build_card(i) for i in range(cards)]
+
+    print("=" * 60)
+    print(f"Parser benchmark: {cards} cards x {rounds} rounds")
+    print("=" * 60)
+
+    expected = bench_html(card_htmls, rounds)
+    bench_lxml(listing, rounds, expected)
+    bench_browser(listing, rounds, expected)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Long-lived headless Chromium for the scraper to connect to over CDP
+
+Run it under its own PM2/systemd unit so scraper restarts reuse the running
+browser instead of launching a new one:
+    pm2 start browser_server.py --interpreter venv/bin/python --name workana-browser
+Then set BROWSER_ENDPOINT=http://127.0.0.1:9222 in .env
+"""
+import os
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from playwright.sync_api import sync_playwright
+from config.settings import BASE_DIR
+
+PORT = int(os.getenv('BROWSER_SERVER_PORT', '9222'))
+PROFILE_DIR = BASE_DIR / 'browser_profile'
+
+
+def main():
+    """Replace this process with Chromium listening for CDP connections on localhost"""
+    with sync_playwright() as playwright:
+        executable = playwright.chromium.executable_path
+
+    args = [
+        executable,
+        '--headless=new',
+        f'--remote-debugging-port={PORT}',
+        '--remote-debugging-address=127.0.0.1',
+        f'--user-data-dir={PROFILE_DIR}',
+        '--no-sandbox',
+        '--disable-dev-shm-usage',
+        '--disable-blink-features=AutomationControlled',
+        '--disable-extensions',
+        'about:blank',
+    ]
+
+    print(f"Starting Chromium with CDP on 127.0.0.1:{PORT}")
+    sys.stdout.flush()
+    # exec so the process supervisor manages Chromium directly
+    os.execv(executable, args)
+
+
+if __name__ == "__main__":
+    main()
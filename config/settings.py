@@ -19,6 +19,30 @@ else:
 # Database settings
 DATABASE_PATH = BASE_DIR / 'workana_jobs.db'
 MAX_JOBS_IN_DB = 500  # Maximum number of jobs to keep in database (oldest jobs are removed when limit is reached)
+KEY_INDEX_MODE = "set"  # In-memory index of stored job keys: "set" (exact keys, O(1) lookups) or "hashed" (sorted array of 64-bit key hashes, 8 bytes per key, O(log n) lookups)
+
+# SQLite connection profile (pragmas applied when the database is opened)
+# "fast": WAL journal so readers (cleanup_db.py, ad-hoc queries) never block the writer,
+# synchronous=NORMAL (commits don't fsync; a power loss can drop the last commits, never corrupt),
+# memory-mapped reads and a larger page cache. "safe": SQLite defaults (rollback journal, synchronous=FULL).
+DB_PROFILE = "fast"  # Options: "fast", "safe"
+DB_PROFILES = {
+    'fast': {
+        'journal_mode': 'WAL',
+        'synchronous': 'NORMAL',
+        'mmap_size': 64 * 1024 * 1024,  # bytes
+        'cache_size': -16000,  # negative = KiB (16 MB)
+        'temp_store': 'MEMORY',
+        'busy_timeout': 5000,  # milliseconds a connection waits for a lock before failing
+    },
+    'safe': {
+        'journal_mode': 'DELETE',
+        'synchronous': 'FULL',
+        'busy_timeout': 5000,
+    },
+}
+DB_CHECKPOINT_INTERVAL = 600  # Seconds between explicit WAL checkpoints (None = rely on SQLite's automatic checkpoints)
+DB_CHECKPOINT_MODE = "PASSIVE"  # Options: "PASSIVE" (never waits for readers), "FULL", "RESTART", "TRUNCATE" (also shrinks the WAL file)
 
 # Scraping settings
 BASE_URL = "https://www.workana.com"
@@ -30,24 +54,113 @@ DEFAULT_LANGUAGE = "en,pt,es"  # English, Portuguese, Spanish
 HEADLESS = True  # Set to False for debugging
 PAGE_LOAD_TIMEOUT = 20000  # milliseconds (20 seconds)
 EXPLICIT_WAIT_TIMEOUT = 5000  # milliseconds (5 seconds)
+READINESS_QUIET_MS = 150  # Page is ready once job cards exist and #projects has not mutated for this long (milliseconds)
+READINESS_MAX_WAIT = 2000  # Upper bound on the readiness wait; the page is used as-is after this (milliseconds)
 
 # Rate limiting (optimized for speed while still being respectful)
 DELAY_BETWEEN_REQUESTS = 1  # seconds (reduced from 3)
 RANDOM_DELAY_RANGE = (0.5, 2)  # Random delay range in seconds (reduced from 2-5)
 
+# Adaptive rate control (AIMD): the page load rate grows additively while the site answers quickly
+# and is cut multiplicatively on timeouts, slow loads, 403/429/503 or challenge pages.
+# State is kept by the scraper across cycles; it replaces DELAY_BETWEEN_REQUESTS + RANDOM_DELAY_RANGE.
+ADAPTIVE_RATE = True  # False = static DELAY_BETWEEN_REQUESTS + RANDOM_DELAY_RANGE
+RATE_MIN_DELAY = 0.3  # Shortest delay between page loads (seconds)
+RATE_MAX_DELAY = 30  # Longest delay between page loads after repeated back-offs (seconds)
+RATE_INCREASE = 0.1  # Requests/second added after each healthy page load
+RATE_DECREASE = 0.5  # Factor applied to the rate on congestion
+RATE_SLOW_LOAD = 5  # Page loads slower than this count as congestion (seconds)
+RATE_JITTER = 0.2  # Relative random jitter applied to each delay
+
 # Scraping limits
 MAX_PAGES = 1  # Maximum pages to scrape (None = no limit)
 STOP_ON_KNOWN_JOB = False  # Stop scraping when encountering known job ID (False = continue scraping)
+INCREMENTAL_CRAWL = False  # Stop paginating once past the stored high-water mark and a run of known non-featured jobs
+INCREMENTAL_KNOWN_RUN = 5  # Consecutive known non-featured jobs that end an incremental crawl (doubled if the high-water mark is not seen)
+SKIP_UNCHANGED_LISTING = True  # Skip parsing/storage when the first page's ordered job IDs match the last processed cycle
+
+# Concurrent scraping (pages after the first are loaded in parallel on a pool of pages sharing one context)
+CONCURRENT_PAGES = 1  # Number of browser pages used for pagination (1 = sequential mode)
+CONCURRENT_REQUEST_INTERVAL = 0.5  # Minimum seconds between navigation starts across all pages (politeness budget)
+
+# Pipelined scraping (page N+1 loads on a second page while page N is parsed; ignored when CONCURRENT_PAGES > 1)
+PIPELINE_PAGES = False
+
+# Streaming: each page's jobs are saved, sent to Slack and exported to Sheets as soon as the page is parsed
+STREAM_PAGES = True  # False = deliver once after the last page
+
+# Listing fetch mode
+FETCH_MODE = "browser"  # Options: "browser" (always render with Playwright), "http" (plain HTTP first, browser only as fallback)
+
+# Card extraction engine
+EXTRACTION_ENGINE = "lxml"  # Options: "lxml" (whole listing parsed once with precompiled XPath), "html" (card HTML parsed with BeautifulSoup), "browser" (fields extracted in-page by JS)
+
+# Batch parsing (parse_jobs_batch): card HTML is parsed in a process pool for large batches (big pages, backfills)
+PARSE_WORKERS = None  # Worker processes (None = number of CPUs)
+PARSE_POOL_MIN_CARDS = 200  # Smaller batches are parsed in-process, where pool overhead would dominate
+
+# Parse cache: parsed cards keyed by a digest of their HTML (identical cards come back every cycle)
+# The "html" and "lxml" engines are cached (lxml cards are looked up before their fields are extracted);
+# "browser" records are extracted in the page, so only those whose extraction failed go through the cache
+PARSE_CACHE_SIZE = 2000  # Maximum cached cards (0 = disabled)
+PARSE_CACHE_PATH = BASE_DIR / 'parse_cache.json'  # Loaded on start and saved on close (None = memory only)
 
 # Scheduler settings
 SCRAPE_INTERVAL = 30  # Seconds between scrapes (set to None to run once and exit)
 
+# Adaptive scheduling (continuous mode): each feed runs on a fixed-rate timeline whose interval
+# follows the recent rate of new jobs for the current hour of day (from scrape_history)
+ADAPTIVE_SCHEDULE = False  # False = fixed interval (feed interval or SCRAPE_INTERVAL); True polls quiet hours as rarely as SCHEDULE_MAX_INTERVAL
+SCHEDULE_MIN_INTERVAL = 15  # Shortest interval when jobs arrive quickly (seconds)
+SCHEDULE_MAX_INTERVAL = 300  # Longest interval when nothing is being posted (seconds)
+SCHEDULE_TARGET_NEW_JOBS = 1  # Poll often enough to expect about this many new jobs per cycle
+SCHEDULE_HISTORY_DAYS = 14  # Days of scrape_history used to estimate arrival rates
+SCHEDULE_OVERRUN = "skip"  # Options: "skip" (drop ticks missed by a long cycle), "catch_up" (run missed ticks back to back)
+
+# Feeds scraped every cycle, all sharing one browser (run in order; jobs already seen in an
+# earlier feed of the same round are skipped before parsing and stored once)
+#   max_pages: page limit for the feed (None = no limit)
+#   concurrent_pages: browser pages used for the feed's pagination (see CONCURRENT_PAGES)
+#   interval: fixed seconds between scrapes of the feed (None = adaptive, or SCRAPE_INTERVAL if ADAPTIVE_SCHEDULE is off)
+FEEDS = [
+    {'category': DEFAULT_CATEGORY, 'language': DEFAULT_LANGUAGE, 'max_pages': MAX_PAGES,
+     'concurrent_pages': CONCURRENT_PAGES, 'interval': None},
+]
+
 # User agent
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
 
 # Browser settings
 BROWSER = "chromium"  # Options: "chromium", "firefox", "webkit"
 
+# Long-lived browser (optional): connect to a separately supervised browser instead of launching one
+# on every restart (see browser_server.py). Falls back to a local launch if the connection fails.
+BROWSER_ENDPOINT = os.getenv('BROWSER_ENDPOINT', '').strip()  # e.g. http://127.0.0.1:9222 (CDP) or ws://... (Playwright server)
+BROWSER_ENDPOINT_TYPE = os.getenv('BROWSER_ENDPOINT_TYPE', 'cdp').strip()  # Options: "cdp", "playwright"
+BROWSER_CONNECT_TIMEOUT = 5000  # milliseconds
+STORAGE_STATE_PATH = BASE_DIR / 'browser_state.json'  # Cookies/localStorage saved on close and restored into new contexts
+
+# Browser memory watchdog (checked between cycles; set a threshold to None to disable that rule)
+RECYCLE_PAGE_RENDERER_MB = 400  # Recycle pages when a renderer process exceeds this RSS
+RECYCLE_CONTEXT_NAVIGATIONS = 500  # Recycle the context after this many page loads in it
+RECYCLE_BROWSER_TOTAL_MB = 1200  # Recycle the browser when all its processes together exceed this RSS (stay below the 2G PM2/systemd limit)
+
+# Resource blocking (applied natively in the browser: CDP URL blocking on Chromium,
+# pattern-limited routes elsewhere, so allowed requests never round-trip into Python)
+BLOCK_RESOURCES = True
+BLOCKED_URL_PATTERNS = [
+    # Images
+    "*.png*", "*.jpg*", "*.jpeg*", "*.gif*", "*.webp*", "*.svg*", "*.ico*",
+    # Fonts
+    "*.woff*", "*.ttf*", "*.eot*", "*.otf*",
+    # Media
+    "*.mp4*", "*.webm*", "*.mp3*", "*.ogg*",
+    # Analytics / third-party trackers
+    "*google-analytics.com*", "*googletagmanager.com*", "*doubleclick.net*",
+    "*googleadservices.com*", "*facebook.net*", "*connect.facebook.com*",
+    "*hotjar.com*", "*clarity.ms*", "*segment.io*", "*intercom.io*",
+]
+
 # Logging
 LOG_LEVEL = "INFO"
 LOG_FILE = BASE_DIR / 'scraper.log'
@@ -3,6 +3,8 @@ Main script for Workana job scraper
 """
 import sys
 import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
@@ -10,182 +12,316 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from config.settings import (
-    DATABASE_PATH, DEFAULT_CATEGORY, DEFAULT_LANGUAGE,
+    DATABASE_PATH, FEEDS, STREAM_PAGES,
     MAX_PAGES, STOP_ON_KNOWN_JOB, SLACK_WEBHOOK_URL, ENABLE_SLACK_NOTIFICATIONS,
     SCRAPE_INTERVAL, ENABLE_SHEETS_EXPORT, GOOGLE_SHEETS_SPREADSHEET_ID, GOOGLE_SHEETS_CREDENTIALS_JSON,
-    MAX_JOBS_IN_DB
+    MAX_JOBS_IN_DB, ADAPTIVE_SCHEDULE, SCHEDULE_HISTORY_DAYS
 )
 from storage.database import WorkanaDatabase
-from scrapers.workana_scraper import WorkanaScraper
+from scrapers.async_scraper import AsyncWorkanaScraper
 from parsers.date_parser import extract_job_id_from_url
 from utils.slack_notifier import SlackNotifier
 from utils.translator import DeepLTranslator
 from utils.sheets_exporter import SheetsExporter
+from utils.scheduler import FeedScheduler
 
 
-def run_scrape(db, scraper, slack_notifier, translator, sheets_exporter):
-    """Run a single scrape cycle"""
+def create_scheduler(feed: dict) -> FeedScheduler:
+    """Create the scheduler of a feed (fixed when the feed sets an interval, adaptive otherwise)"""
+    interval = feed.get('interval')
+    return FeedScheduler(
+        interval=interval or SCRAPE_INTERVAL,
+        adaptive=ADAPTIVE_SCHEDULE and not interval
+    )
+
+
+def reschedule_feed(db, feed: dict, scheduler: FeedScheduler):
+    """Adapt the feed's interval to its recent arrival rate and move to the next tick"""
+    scheduler.update_interval(db.get_hourly_arrival_rates(feed['category'], feed['language'], SCHEDULE_HISTORY_DAYS))
+    scheduler.advance()
+    print(f"   Feed {feed['category']} [{feed['language']}]: {scheduler.describe()}, "
+          f"next at {scheduler.next_run_datetime().strftime('%H:%M:%S')}")
+
+
+async def run_feeds(db, scraper, feeds, slack_notifier, translator, sheets_exporter, delivery_queue):
+    """
+    Run one scrape cycle for each feed on the shared scraper.
+    Jobs found by an earlier feed are skipped by later feeds of the same round.
+    """
+    seen_job_ids = set()
+    for feed in feeds:
+        await run_scrape(db, scraper, slack_notifier, translator, sheets_exporter, delivery_queue,
+                         feed=feed, seen_job_ids=seen_job_ids)
+
+
+def store_jobs(db, jobs):
+    """
+    Save scraped jobs to the database in one transaction
+    Returns: (new jobs, number of updated jobs)
+    """
+    jobs = [job for job in jobs if job.id]
+    new_ids = db.save_jobs(jobs)
+    new_jobs = [job for job in jobs if job.id in new_ids]
+    return new_jobs, len(jobs) - len(new_jobs)
+
+
+def send_to_slack(db, slack_notifier, new_jobs):
+    """
+    Send new jobs to Slack individually
+    Only sends jobs that haven't been sent before (prevent duplicates)
+    """
+    # Filter out jobs that have already been sent to Slack (one query for the batch)
+    unsent_ids = db.get_jobs_not_sent_to_slack([job.id for job in new_jobs if job.id])
+    unsent_jobs = []
+    for job in new_jobs:
+        job_id = job.id
+        if not job_id:
+            print(f"⚠️  Skipping job without ID: {(job.title or 'Unknown')[:50]}")
+            continue
+        if job_id in unsent_ids:
+            unsent_jobs.append(job)
+        else:
+            print(f"ℹ️  Job {job_id} already sent to Slack, skipping")
+    
+    if unsent_jobs:
+        print(f"📤 Sending {len(unsent_jobs)} job(s) individually to Slack...")
+        
+        sent_ids = []
+        failed_count = 0
+        try:
+            for i, job in enumerate(unsent_jobs, 1):
+                job_id = job.id
+                job_title = (job.title or 'Unknown')[:50]
+                print(f"   [{i}/{len(unsent_jobs)}] Sending job: {job_title}...")
+                if slack_notifier.send_single_job(job):
+                    sent_ids.append(job_id)
+                    print(f"   ✅ Job {job_id} sent")
+                else:
+                    failed_count += 1
+                    print(f"   ❌ Failed to send job {job_id}")
+                
+                # Small delay between messages to avoid rate limiting
+                if i < len(unsent_jobs):
+                    time.sleep(0.5)
+        finally:
+            # Mark sent jobs in one transaction (even if sending was interrupted) to prevent duplicates
+            marked_count = db.mark_jobs_sent_to_slack(sent_ids)
+            if marked_count != len(sent_ids):
+                print(f"⚠️  Sent {len(sent_ids)} job(s), but only {marked_count} were marked as sent in database")
+        
+        print(f"✅ Sent {len(sent_ids)}/{len(unsent_jobs)} job notifications to Slack")
+        if failed_count > 0:
+            print(f"⚠️  {failed_count} job(s) failed to send")
+    else:
+        print(f"ℹ️  All {len(new_jobs)} new job(s) were already sent to Slack (skipping duplicates)")
+
+
+def export_to_sheets(db, sheets_exporter, new_jobs):
+    """
+    Export new jobs to Google Sheets (daily sheet)
+    Uses new_jobs directly instead of querying database to avoid timing/timezone issues
+    """
+    try:
+        # Ensure today's sheet exists (create if it doesn't)
+        sheets_exporter.ensure_today_sheet_exists()
+        
+        # Filter out jobs that have already been exported (one query for the batch)
+        # Use new_jobs directly instead of querying database
+        unexported_ids = db.get_jobs_not_exported_to_sheets([job.id for job in new_jobs if job.id])
+        unexported_jobs = []
+        for job in new_jobs:
+            job_id = job.id
+            if not job_id:
+                print(f"⚠️  Skipping job without ID for Sheets export: {(job.title or 'Unknown')[:50]}")
+                continue
+            if job_id in unexported_ids:
+                unexported_jobs.append(job)
+            else:
+                print(f"ℹ️  Job {job_id} already exported to Sheets, skipping")
+        
+        if unexported_jobs:
+            print(f"📊 Exporting {len(unexported_jobs)} job(s) to Google Sheets...")
+            exported_count = sheets_exporter.export_jobs(unexported_jobs)
+            
+            # Verify export count
+            if exported_count == 0:
+                print(f"⚠️  Warning: No jobs were exported, but {len(unexported_jobs)} job(s) were provided")
+            elif exported_count != len(unexported_jobs):
+                print(f"⚠️  Warning: Expected {len(unexported_jobs)} job(s) to be exported, but only {exported_count} were exported")
+            else:
+                print(f"✅ Successfully exported {exported_count} job(s) to Google Sheets")
+            
+            # Mark jobs as exported in one transaction (only the ones that were actually exported)
+            marked_count = db.mark_jobs_exported_to_sheets([job.id for job in unexported_jobs[:exported_count]])
+            if marked_count:
+                print(f"   ✅ {marked_count} job(s) marked as exported in database")
+            
+            if marked_count != exported_count:
+                print(f"⚠️  Warning: Exported {exported_count} job(s), but only {marked_count} were marked as exported in database")
+        else:
+            print(f"ℹ️  All {len(new_jobs)} new job(s) were already exported to Google Sheets")
+    except ConnectionError as e:
+        print(f"⚠️  Network error exporting to Google Sheets: {e}")
+        print("   Jobs will be exported when network connection is restored.")
+    except Exception as e:
+        print(f"⚠️  Error exporting to Google Sheets: {e}")
+        import traceback
+        traceback.print_exc()
+
+
+def deliver_new_jobs(db, slack_notifier, sheets_exporter, new_jobs):
+    """Send new jobs to Slack and export them to Google Sheets (blocking)"""
+    if slack_notifier:
+        send_to_slack(db, slack_notifier, new_jobs)
+    if sheets_exporter and sheets_exporter.is_available():
+        export_to_sheets(db, sheets_exporter, new_jobs)
+
+
+async def run_delivery(db_path, delivery_queue, slack_notifier, sheets_exporter):
+    """
+    Delivery task: deliver queued batches of new jobs while scraping goes on.
+    The blocking Slack/Sheets calls run on one worker thread with its own
+    database connection (sqlite3 connections stay on the thread that opened them).
+    A None in the queue stops the task once earlier batches are delivered.
+    """
+    loop = asyncio.get_running_loop()
+    executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='delivery')
+    delivery_db = await loop.run_in_executor(executor, WorkanaDatabase, db_path)
+    try:
+        while True:
+            new_jobs = await delivery_queue.get()
+            if new_jobs is None:
+                break
+            try:
+                await loop.run_in_executor(executor, deliver_new_jobs, delivery_db, slack_notifier, sheets_exporter, new_jobs)
+            except Exception as e:
+                print(f"❌ Error delivering {len(new_jobs)} job(s): {e}")
+    finally:
+        await loop.run_in_executor(executor, delivery_db.close)
+        executor.shutdown()
+
+
+async def scrape_batches(scraper, scrape_args):
+    """Yield the scraped jobs page by page (STREAM_PAGES) or as one batch per cycle"""
+    if STREAM_PAGES:
+        async for scraped_jobs in scraper.scrape_pages(**scrape_args):
+            yield scraped_jobs
+    else:
+        yield await scraper.scrape(**scrape_args)
+
+
+async def run_scrape(db, scraper, slack_notifier, translator, sheets_exporter, delivery_queue, feed=None, seen_job_ids=None):
+    """
+    Run a single scrape cycle for one feed (defaults to the first of FEEDS)
+    New jobs are queued for the delivery task (see run_delivery) as soon as they are stored
+    seen_job_ids: job IDs already handled this round; updated with this feed's jobs
+    """
     start_time = time.time()
     
-    # Get existing job IDs
-    existing_job_ids = db.get_existing_job_ids()
+    feed = feed or FEEDS[0]
+    category = feed['category']
+    language = feed['language']
+    max_pages = feed.get('max_pages', MAX_PAGES)
+    if seen_job_ids is None:
+        seen_job_ids = set()
+    
+    # Keys of stored jobs (in-memory index kept up to date by the database, no table scan)
+    existing_job_ids = db.job_keys
+    
+    # Newest non-featured job from the last cycle of this feed (incremental crawl)
+    high_water_mark = db.get_high_water_mark(category, language)
     
     try:
         # Scrape jobs
         print(f"\n[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] Starting scrape...")
-        print(f"Category: {DEFAULT_CATEGORY} | Language: {DEFAULT_LANGUAGE} | Max pages: {MAX_PAGES or 'No limit'}")
+        print(f"Category: {category} | Language: {language} | Max pages: {max_pages or 'No limit'}")
         print("-" * 60)
         
-        scraped_jobs = scraper.scrape(
-            category=DEFAULT_CATEGORY,
-            language=DEFAULT_LANGUAGE,
+        scrape_args = dict(
+            category=category,
+            language=language,
             existing_job_ids=existing_job_ids,
-            max_pages=MAX_PAGES
+            max_pages=max_pages,
+            high_water_mark=high_water_mark['newest_job_id'] if high_water_mark else None,
+            concurrent_pages=feed.get('concurrent_pages'),
+            skip_job_ids=seen_job_ids
         )
         
-        print(f"Scraped {len(scraped_jobs)} jobs total")
-        
-        # Save jobs to database
-        new_jobs = []
+        # Streaming: store and queue each page's jobs for delivery as soon as the page is parsed
+        deliver = slack_notifier or (sheets_exporter and sheets_exporter.is_available())
+        jobs_found = 0
+        new_jobs_count = 0
         updated_jobs = 0
-        
-        for job in scraped_jobs:
-            if not job.get('id'):
-                continue
+        async for scraped_jobs in scrape_batches(scraper, scrape_args):
+            # Drop jobs repeated within this feed, then remember them for the next feeds
+            unique_jobs = []
+            for job in scraped_jobs:
+                if job.id and job.id not in seen_job_ids:
+                    seen_job_ids.add(job.id)
+                    unique_jobs.append(job)
+            jobs_found += len(unique_jobs)
             
-            is_new = db.save_job(job)
-            if is_new:
-                new_jobs.append(job)
-            else:
-                updated_jobs += 1
+            new_jobs, updated = store_jobs(db, unique_jobs)
+            new_jobs_count += len(new_jobs)
+            updated_jobs += updated
+            
+            if new_jobs and deliver:
+                delivery_queue.put_nowait(new_jobs)
+        
+        print(f"Scraped {jobs_found} jobs total")
+        print(f"Scraper metrics: {scraper.format_metrics()}")
+        for record in scraper.readiness_log:
+            timed_out = " (max wait reached)" if record['timed_out'] else ""
+            print(f"   Page ready after {record['reason']} in {record['seconds']:.2f}s{timed_out}: {record['url']}")
         
-        print(f"New jobs: {len(new_jobs)} | Updated jobs: {updated_jobs}")
+        # Nothing changed on the listing: record a cheap history row and skip parsing, storage and export
+        if scraper.cycle_unchanged:
+            duration = time.time() - start_time
+            db.save_scrape_history(
+                jobs_found=0,
+                new_jobs_count=0,
+                pages_scraped=1,
+                duration_seconds=duration,
+                category=category,
+                language=language,
+                status='unchanged'
+            )
+            print(f"Listing unchanged, cycle skipped | Duration: {duration:.1f}s")
+            return True
+        
+        print(f"New jobs: {new_jobs_count} | Updated jobs: {updated_jobs}")
+        
+        # Jobs are stored, so an identical listing next cycle can be skipped
+        scraper.mark_cycle_processed()
+        
+        # Move the high-water mark to the newest non-featured job of this cycle
+        newest_job = scraper.crawl_state.get('newest_job')
+        if newest_job:
+            db.save_high_water_mark(category, language, newest_job[0], newest_job[1])
         
-        # Send Slack notification for new jobs (individually)
-        # Only send jobs that haven't been sent before (prevent duplicates)
         if not slack_notifier:
             print("ℹ️  Slack notifier not configured, skipping Slack notifications")
-        elif not new_jobs:
+        elif not new_jobs_count:
             print("ℹ️  No new jobs to send to Slack")
-        else:
-            # Filter out jobs that have already been sent to Slack
-            unsent_jobs = []
-            for job in new_jobs:
-                job_id = job.get('id')
-                if not job_id:
-                    print(f"⚠️  Skipping job without ID: {job.get('title', 'Unknown')[:50]}")
-                    continue
-                if db.is_job_sent_to_slack(job_id):
-                    print(f"ℹ️  Job {job_id} already sent to Slack, skipping")
-                else:
-                    unsent_jobs.append(job)
-            
-            if unsent_jobs:
-                print(f"📤 Sending {len(unsent_jobs)} job(s) individually to Slack...")
-                
-                success_count = 0
-                failed_count = 0
-                for i, job in enumerate(unsent_jobs, 1):
-                    job_id = job.get('id')
-                    job_title = job.get('title', 'Unknown')[:50]
-                    print(f"   [{i}/{len(unsent_jobs)}] Sending job: {job_title}...")
-                    success = slack_notifier.send_single_job(job)
-                    if success and job_id:
-                        # Mark as sent to prevent duplicates
-                        if db.mark_job_sent_to_slack(job_id):
-                            success_count += 1
-                            print(f"   ✅ Job {job_id} sent and marked in database")
-                        else:
-                            print(f"   ⚠️  Job {job_id} sent but failed to mark in database")
-                    else:
-                        failed_count += 1
-                        print(f"   ❌ Failed to send job {job_id}")
-                    
-                    # Small delay between messages to avoid rate limiting
-                    if i < len(unsent_jobs):
-                        time.sleep(0.5)
-                
-                print(f"✅ Sent {success_count}/{len(unsent_jobs)} job notifications to Slack")
-                if failed_count > 0:
-                    print(f"⚠️  {failed_count} job(s) failed to send")
-            else:
-                print(f"ℹ️  All {len(new_jobs)} new job(s) were already sent to Slack (skipping duplicates)")
         
-        # Calculate pages scraped (approximate)
-        pages_scraped = len(scraped_jobs) // 20  # Assuming ~20 jobs per page
+        if not sheets_exporter:
+            print("ℹ️  Google Sheets exporter not configured, skipping export")
+        elif not sheets_exporter.is_available():
+            print("ℹ️  Google Sheets exporter not available, skipping export")
+        elif not new_jobs_count:
+            print("ℹ️  No new jobs to export to Google Sheets")
         
         # Save scrape history
         duration = time.time() - start_time
         db.save_scrape_history(
-            jobs_found=len(scraped_jobs),
-            new_jobs_count=len(new_jobs),
-            pages_scraped=pages_scraped,
+            jobs_found=jobs_found,
+            new_jobs_count=new_jobs_count,
+            pages_scraped=scraper.metrics['pages_http'] + scraper.metrics['pages_browser'],
             duration_seconds=duration,
-            category=DEFAULT_CATEGORY,
-            language=DEFAULT_LANGUAGE
+            category=category,
+            language=language
         )
         
-        # Export jobs to Google Sheets (daily sheet)
-        # Use new_jobs directly instead of querying database to avoid timing/timezone issues
-        if not sheets_exporter:
-            print("ℹ️  Google Sheets exporter not configured, skipping export")
-        elif not sheets_exporter.is_available():
-            print("ℹ️  Google Sheets exporter not available, skipping export")
-        elif not new_jobs:
-            print("ℹ️  No new jobs to export to Google Sheets")
-        else:
-            try:
-                # Ensure today's sheet exists (create if it doesn't)
-                sheets_exporter.ensure_today_sheet_exists()
-                
-                # Filter out jobs that have already been exported
-                # Use new_jobs directly instead of querying database
-                unexported_jobs = []
-                for job in new_jobs:
-                    job_id = job.get('id')
-                    if not job_id:
-                        print(f"⚠️  Skipping job without ID for Sheets export: {job.get('title', 'Unknown')[:50]}")
-                        continue
-                    if db.is_job_exported_to_sheets(job_id):
-                        print(f"ℹ️  Job {job_id} already exported to Sheets, skipping")
-                    else:
-                        unexported_jobs.append(job)
-                
-                if unexported_jobs:
-                    print(f"📊 Exporting {len(unexported_jobs)} job(s) to Google Sheets...")
-                    exported_count = sheets_exporter.export_jobs(unexported_jobs)
-                    
-                    # Verify export count
-                    if exported_count == 0:
-                        print(f"⚠️  Warning: No jobs were exported, but {len(unexported_jobs)} job(s) were provided")
-                    elif exported_count != len(unexported_jobs):
-                        print(f"⚠️  Warning: Expected {len(unexported_jobs)} job(s) to be exported, but only {exported_count} were exported")
-                    else:
-                        print(f"✅ Successfully exported {exported_count} job(s) to Google Sheets")
-                    
-                    # Mark jobs as exported (only mark the ones that were actually exported)
-                    marked_count = 0
-                    for job in unexported_jobs[:exported_count]:
-                        job_id = job.get('id')
-                        if job_id:
-                            if db.mark_job_exported_to_sheets(job_id):
-                                marked_count += 1
-                                print(f"   ✅ Job {job_id} marked as exported in database")
-                            else:
-                                print(f"   ⚠️  Failed to mark job {job_id} as exported in database")
-                    
-                    if marked_count != exported_count:
-                        print(f"⚠️  Warning: Exported {exported_count} job(s), but only {marked_count} were marked as exported in database")
-                else:
-                    print(f"ℹ️  All {len(new_jobs)} new job(s) were already exported to Google Sheets")
-            except ConnectionError as e:
-                print(f"⚠️  Network error exporting to Google Sheets: {e}")
-                print("   Jobs will be exported when network connection is restored.")
-            except Exception as e:
-                print(f"⚠️  Error exporting to Google Sheets: {e}")
-                import traceback
-                traceback.print_exc()
-        
         # Display brief statistics
         stats = db.get_statistics()
         print(f"Total jobs in DB: {stats['total_jobs']} | New (24h): {stats['new_jobs_24h']} | Duration: {duration:.1f}s")
@@ -199,14 +335,21 @@ def run_scrape(db, scraper, slack_notifier, translator, sheets_exporter):
         return False
 
 
-def main():
-    """Main execution function"""
+async def main_async():
+    """
+    Main execution function
+    Scraping, delivery (a background task, see run_delivery) and housekeeping
+    share one event loop, so Slack/Sheets delivery does not hold up the scraper.
+    """
     print("=" * 60)
     print("Workana Job Scraper")
     print("=" * 60)
     
     if SCRAPE_INTERVAL:
-        print(f"🔄 Running in continuous mode (every {SCRAPE_INTERVAL} seconds)")
+        if ADAPTIVE_SCHEDULE:
+            print(f"🔄 Running in continuous mode (adaptive interval, starting at {SCRAPE_INTERVAL} seconds)")
+        else:
+            print(f"🔄 Running in continuous mode (every {SCRAPE_INTERVAL} seconds)")
         print("   Press Ctrl+C to stop")
     else:
         print("▶️  Running once")
@@ -214,6 +357,7 @@ def main():
     # Initialize database
     print("\n[1/5] Initializing database...")
     db = WorkanaDatabase(str(DATABASE_PATH))
+    print(f"   SQLite profile: {db.describe_profile()}")
     
     # Cleanup old jobs to maintain limit
     removed_count = db.cleanup_old_jobs()
@@ -268,38 +412,61 @@ def main():
     
     # Initialize scraper
     print("[5/6] Initializing scraper...")
-    scraper = WorkanaScraper()
-    scraper.setup_driver()
+    scraper = AsyncWorkanaScraper()
+    setup_start = time.time()
+    await scraper.setup_driver()
+    print(f"   Scraper startup took {time.time() - setup_start:.2f}s")
     
     print("[6/6] Setup complete!")
     print("=" * 60)
     
+    # Delivery runs next to the scraper and drains its queue before shutdown
+    delivery_queue = asyncio.Queue()
+    delivery_task = asyncio.create_task(run_delivery(db.db_path, delivery_queue, slack_notifier, sheets_exporter))
+    
     try:
         if SCRAPE_INTERVAL:
-            # Continuous mode - run every SCRAPE_INTERVAL seconds
+            # Continuous mode - each feed runs on its own fixed-rate timeline
             run_count = 0
+            schedulers = [create_scheduler(feed) for feed in FEEDS]
             while True:
                 run_count += 1
                 print(f"\n{'='*60}")
                 print(f"Run #{run_count}")
                 print(f"{'='*60}")
                 
-                run_scrape(db, scraper, slack_notifier, translator, sheets_exporter)
+                due = [index for index, scheduler in enumerate(schedulers) if scheduler.is_due()]
+                await run_feeds(db, scraper, [FEEDS[index] for index in due], slack_notifier, translator, sheets_exporter,
+                                delivery_queue)
+                
+                # Recycle page/context/browser if the memory watchdog thresholds are crossed
+                await scraper.check_memory_and_recycle()
                 
-                # Calculate next run time
-                next_run = datetime.now().timestamp() + SCRAPE_INTERVAL
-                next_run_str = datetime.fromtimestamp(next_run).strftime('%H:%M:%S')
-                print(f"\n⏰ Next run in {SCRAPE_INTERVAL} seconds (at {next_run_str})")
+                # Keep the WAL file short
+                checkpoint = db.checkpoint_if_due()
+                if checkpoint:
+                    print(f"🧹 WAL checkpoint: {checkpoint[2]}/{checkpoint[1]} frame(s) copied{' (busy)' if checkpoint[0] else ''}")
+                
+                # Schedule the next tick of each feed that ran
+                print("\n📅 Schedule:")
+                for index in due:
+                    reschedule_feed(db, FEEDS[index], schedulers[index])
+                
+                # Calculate next run time (earliest due feed)
+                next_scheduler = min(schedulers, key=lambda scheduler: scheduler.seconds_until_due())
+                wait = next_scheduler.seconds_until_due()
+                next_run_str = next_scheduler.next_run_datetime().strftime('%H:%M:%S')
+                print(f"\n⏰ Next run in {wait:.0f} seconds (at {next_run_str})")
                 print("   Press Ctrl+C to stop")
                 
-                # Wait for next run
-                time.sleep(SCRAPE_INTERVAL)
+                # Wait for next run (delivery keeps going meanwhile)
+                await asyncio.sleep(wait)
         else:
             # Single run mode
-            run_scrape(db, scraper, slack_notifier, translator, sheets_exporter)
+            await run_feeds(db, scraper, FEEDS, slack_notifier, translator, sheets_exporter, delivery_queue)
             print("\n✅ Scraping complete!")
             
-    except KeyboardInterrupt:
+    except (KeyboardInterrupt, asyncio.CancelledError):
         print("\n\n⚠️  Scraping interrupted by user")
     except Exception as e:
         print(f"\n\n❌ Fatal error: {e}")
@@ -308,11 +475,23 @@ def main():
     finally:
         # Cleanup
         print("\nCleaning up...")
-        scraper.close()
+        if not delivery_queue.empty():
+            print(f"📤 Finishing delivery of {delivery_queue.qsize()} queued batch(es)...")
+        delivery_queue.put_nowait(None)
+        await delivery_task
+        await scraper.close()
         db.close()
         print("Done!")
 
 
+def main():
+    """Run main_async on a new event loop"""
+    try:
+        asyncio.run(main_async())
+    except KeyboardInterrupt:
+        pass  # Already reported and cleaned up by main_async
+
+
 if __name__ == "__main__":
     main()
 
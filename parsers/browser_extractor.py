@@ -0,0 +1,105 @@
+"""
+In-browser extraction of job card fields.
+
+Runs the SELECTORS map inside the page as a single JS function and returns
+one plain JSON record per card with the raw fields expected by
+build_job_data, so cards never have to be re-parsed with BeautifulSoup.
+Cards that fail in the browser come back as {'error': ..., 'html': ...}
+and are parsed with parse_job_element_from_html instead.
+"""
+from typing import Dict, List
+from config.selectors import SELECTORS
+from parsers.job import Job
+from parsers.job_parser import build_job_data, parse_job_element_from_html
+
+
+# Text extraction mirrors BeautifulSoup's get_text(strip=True): every descendant
+# text node (outside script/style/template) is stripped and joined without a separator.
+EXTRACT_JOB_FIELDS_JS = """
+({itemSelector, selectors}) => {
+    const skipped = new Set(['SCRIPT', 'STYLE', 'TEMPLATE']);
+    const textOf = (element) => {
+        if (!element) return null;
+        const parts = [];
+        const walker = document.createTreeWalker(element, NodeFilter.SHOW_TEXT | NodeFilter.SHOW_CDATA_SECTION);
+        while (walker.nextNode()) {
+            const node = walker.currentNode;
+            if (node.parentElement && skipped.has(node.parentElement.tagName)) continue;
+            const value = node.nodeValue.trim();
+            if (value) parts.push(value);
+        }
+        return parts.join('');
+    };
+
+    const records = [];
+    for (const card of document.querySelectorAll(itemSelector)) {
+        try {
+            const find = (selector, root = card) => root.querySelector(selector);
+            const title = find(selectors.job_title);
+            const author = find('div.project-author');
+            const record = {
+                title: textOf(title),
+                href: title ? (title.getAttribute('href') || '') : null,
+                date: textOf(find(selectors.job_date)),
+                bids: textOf(find(selectors.job_bids)),
+                description: textOf(find(selectors.job_description)),
+                budget: textOf(find(selectors.job_budget)),
+                skills: Array.from(card.querySelectorAll(selectors.job_skills), textOf),
+                has_max_badge: find(selectors.job_featured_badge) !== null,
+                is_featured: card.classList.contains('project-item-featured'),
+                has_author: author !== null,
+            };
+            if (author) {
+                const country = find(selectors.client_country, author)
+                    || find('span.country-name > a', author)
+                    || find('span.country > a', author);
+                let stars = find(selectors.client_rating, author);
+                if (!stars) {
+                    const profileStars = find('span.rating > span.profile-stars', author);
+                    stars = profileStars ? find('span.stars-bg', profileStars) : null;
+                }
+                record.client_name = textOf(find(selectors.client_name, author));
+                record.client_country = textOf(country);
+                record.rating_title = stars ? (stars.getAttribute('title') || '') : null;
+                record.payment_verified = find(selectors.client_payment_verified, author) !== null;
+                record.last_reply = textOf(find(selectors.client_last_reply, author));
+            }
+            records.push(record);
+        } catch (error) {
+            records.push({error: String(error), html: card.outerHTML});
+        }
+    }
+    return records;
+}
+"""
+
+
+def extractor_args() -> Dict:
+    """Arguments passed to EXTRACT_JOB_FIELDS_JS"""
+    return {
+        'itemSelector': SELECTORS['job_item'],
+        'selectors': SELECTORS,
+    }
+
+
+def extract_job_records(page) -> List[Dict]:
+    """Run the field extractor on a Playwright page and return one record per card"""
+    return page.evaluate(EXTRACT_JOB_FIELDS_JS, extractor_args())
+
+
+async def extract_job_records_async(page) -> List[Dict]:
+    """Run the field extractor on an async Playwright page and return one record per card"""
+    return await page.evaluate(EXTRACT_JOB_FIELDS_JS, extractor_args())
+
+
+def parse_job_record(record: Dict, base_url: str = "https://www.workana.com") -> Job:
+    """
+    Convert a browser record to a Job.
+    Falls back to the BeautifulSoup parser for cards that failed in the browser.
+    Records served from the parse cache (see extract_listing_records) already hold the Job.
+    """
+    if 'job' in record:
+        return record['job']
+    if record.get('error'):
+        return parse_job_element_from_html(record.get('html') or '', base_url)
+    return build_job_data(record, base_url)
@@ -3,82 +3,137 @@ Parser for converting relative dates to absolute timestamps
 """
 import re
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import Iterable, List, Optional, Union
 
 
-def parse_relative_date(date_text: str) -> Optional[datetime]:
+# Phrases with a fixed age (English, Spanish, Portuguese)
+FIXED_PHRASES = {
+    'just now': timedelta(seconds=30),  # Approximate as 30 seconds ago
+    'now': timedelta(seconds=30),
+    'justo ahora': timedelta(seconds=30),
+    'ahora mismo': timedelta(seconds=30),
+    'hace instantes': timedelta(seconds=30),
+    'hace unos instantes': timedelta(seconds=30),
+    'hace un momento': timedelta(seconds=30),
+    'agora mesmo': timedelta(seconds=30),
+    'agora': timedelta(seconds=30),
+    'há instantes': timedelta(seconds=30),
+    'há poucos instantes': timedelta(seconds=30),
+    'há pouco': timedelta(seconds=30),
+    'almost an hour': timedelta(hours=1, minutes=30),
+    'almost 1 hour': timedelta(hours=1, minutes=30),
+    'casi una hora': timedelta(hours=1, minutes=30),
+    'quase uma hora': timedelta(hours=1, minutes=30),
+    'yesterday': timedelta(days=1, hours=12),  # Approximate as yesterday noon
+    'ayer': timedelta(days=1, hours=12),
+    'ontem': timedelta(days=1, hours=12),
+}
+
+# Unit words -> timedelta of one unit
+UNITS = {
+    **dict.fromkeys(['minute', 'minutes', 'min', 'mins', 'minuto', 'minutos'], timedelta(minutes=1)),
+    **dict.fromkeys(['hour', 'hours', 'hr', 'hrs', 'hora', 'horas'], timedelta(hours=1)),
+    **dict.fromkeys(['day', 'days', 'd', 'ds', 'dia', 'dias', 'día', 'días'], timedelta(days=1)),
+    **dict.fromkeys(['week', 'weeks', 'w', 'ws', 'semana', 'semanas'], timedelta(weeks=1)),
+    # Approximate month as 30 days
+    **dict.fromkeys(['month', 'months', 'mo', 'mos', 'mes', 'meses', 'mês'], timedelta(days=30)),
+}
+
+# Number words meaning "one" ("an hour ago", "hace una hora", "há um dia")
+ONE_WORDS = ['an', 'a', 'one', 'una', 'un', 'uma', 'um']
+
+# Prefixes removed before parsing
+PUBLISHED_PREFIXES = ('published:', 'publicado:')
+
+
+def _alternation(words: Iterable[str]) -> str:
+    """Regex alternation of literal words, longest first so prefixes don't win"""
+    return '|'.join(re.escape(word) for word in sorted(words, key=len, reverse=True))
+
+
+# One grammar for every supported phrasing: a fixed phrase, or
+# "<count> <unit>" introduced by "hace"/"há" or followed by "ago"/"atrás"
+RELATIVE_DATE_PATTERN = re.compile(
+    rf"""
+    (?<!\w)(?P<phrase>{_alternation(FIXED_PHRASES)})(?!\w)
+    |
+    (?:(?<!\w)(?P<prefix>hace|há|ha)\s+)?
+    (?:(?<!\w)(?P<number>\d+)\s*|(?<!\w)(?P<one>{_alternation(ONE_WORDS)})\s+)
+    (?P<unit>{_alternation(UNITS)})(?!\w)
+    (?:\s*(?P<suffix>ago|atrás))?
+    """,
+    re.VERBOSE
+)
+
+# Absolute date formats tried when no relative phrase matches
+ABSOLUTE_DATE_FORMATS = ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%B %d, %Y']
+
+
+def normalize_date_text(date_text: str) -> str:
+    """Lowercase, collapse whitespace and drop a "Published:" prefix"""
+    text = ' '.join(date_text.lower().split())
+    for prefix in PUBLISHED_PREFIXES:
+        if text.startswith(prefix):
+            return text[len(prefix):].lstrip()
+    return text
+
+
+@lru_cache(maxsize=256)
+def _parse_normalized(text: str) -> Union[timedelta, datetime, None]:
     """
-    Parse relative date strings like "20 hours ago", "Just now", "Yesterday"
-    Returns datetime object or None if parsing fails
+    Parse normalized date text into an age (timedelta) or an absolute datetime.
+    Cached: only a few dozen distinct strings ever occur.
     """
-    if not date_text:
+    if not text:
         return None
-    
-    # Clean the text
-    date_text = date_text.strip().lower()
-    
-    # Remove "Published: " prefix if present
-    date_text = re.sub(r'^published:\s*', '', date_text, flags=re.IGNORECASE)
-    
-    now = datetime.now()
-    
-    # "Just now" or "now"
-    if 'just now' in date_text or date_text == 'now':
-        return now - timedelta(seconds=30)  # Approximate as 30 seconds ago
-    
-    # Minutes ago
-    match = re.search(r'(\d+)\s*(?:minute|min)s?\s*ago', date_text)
-    if match:
-        minutes = int(match.group(1))
-        return now - timedelta(minutes=minutes)
-    
-    # Hours ago
-    match = re.search(r'(\d+)\s*(?:hour|hr)s?\s*ago', date_text)
-    if match:
-        hours = int(match.group(1))
-        return now - timedelta(hours=hours)
-    
-    # "Almost an hour ago" or "Almost 1 hour ago"
-    if 'almost an hour ago' in date_text or 'almost 1 hour ago' in date_text:
-        return now - timedelta(hours=1, minutes=30)
-    
-    # Days ago
-    match = re.search(r'(\d+)\s*(?:day|d)s?\s*ago', date_text)
-    if match:
-        days = int(match.group(1))
-        return now - timedelta(days=days)
-    
-    # "Yesterday"
-    if 'yesterday' in date_text:
-        return now - timedelta(days=1, hours=12)  # Approximate as yesterday noon
-    
-    # Weeks ago
-    match = re.search(r'(\d+)\s*(?:week|w)s?\s*ago', date_text)
-    if match:
-        weeks = int(match.group(1))
-        return now - timedelta(weeks=weeks)
-    
-    # Months ago
-    match = re.search(r'(\d+)\s*(?:month|mo)s?\s*ago', date_text)
-    if match:
-        months = int(match.group(1))
-        return now - timedelta(days=months * 30)  # Approximate month as 30 days
-    
-    # Try to parse as absolute date if relative parsing fails
-    try:
-        # Try common date formats
-        for fmt in ['%Y-%m-%d', '%m/%d/%Y', '%d/%m/%Y', '%B %d, %Y']:
-            try:
-                return datetime.strptime(date_text, fmt)
-            except ValueError:
+
+    for match in RELATIVE_DATE_PATTERN.finditer(text):
+        phrase = match.group('phrase')
+        if phrase:
+            # Bare "now" only counts as the whole text
+            if phrase == 'now' and text != 'now':
                 continue
-    except:
-        pass
-    
-    # If all parsing fails, return None
+            return FIXED_PHRASES[phrase]
+        # A count needs a direction ("5 minutes ago", "hace 5 minutos", "há 5 minutos", "5 minutos atrás")
+        if match.group('prefix') or match.group('suffix'):
+            count = int(match.group('number')) if match.group('number') else 1
+            return UNITS[match.group('unit')] * count
+
+    # Try to parse as absolute date if relative parsing fails
+    for fmt in ABSOLUTE_DATE_FORMATS:
+        try:
+            return datetime.strptime(text, fmt)
+        except ValueError:
+            continue
+
     return None
 
 
+def parse_relative_date(date_text: str, now: Optional[datetime] = None) -> Optional[datetime]:
+    """
+    Parse relative date strings like "20 hours ago", "Just now", "Yesterday",
+    "Hace 3 horas", "Há 2 dias" (English, Spanish, Portuguese)
+    Returns datetime object or None if parsing fails
+    """
+    if not date_text:
+        return None
+
+    parsed = _parse_normalized(normalize_date_text(date_text))
+    if isinstance(parsed, timedelta):
+        return (now or datetime.now()) - parsed
+    return parsed
+
+
+def parse_relative_dates(texts: Iterable[str], now: Optional[datetime] = None) -> List[Optional[datetime]]:
+    """
+    Parse many relative date strings against a single reference clock
+    Returns one datetime (or None) per input text, in order
+    """
+    now = now or datetime.now()
+    return [parse_relative_date(text, now) for text in texts]
+
+
 def extract_job_id_from_url(url: str) -> str:
     """
     Extract unique job ID from Workana job URL
@@ -0,0 +1,124 @@
+"""
+Job record passed from the parsers through storage and delivery
+"""
+import json
+from dataclasses import dataclass, field, fields, replace
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Columns of the jobs table written from a Job, in to_row() order
+JOB_COLUMNS = (
+    'id', 'title', 'description', 'url', 'posted_date_relative',
+    'posted_date_timestamp', 'bids_count', 'budget', 'budget_min',
+    'budget_max', 'budget_type', 'skills', 'client_name',
+    'client_country', 'client_rating', 'client_payment_verified',
+    'client_last_reply', 'is_featured', 'is_max_project',
+)
+
+
+@dataclass(slots=True)
+class Job:
+    """
+    One parsed job card.
+    Fields match the keys of the job dicts used before, and the dict-style
+    methods (get, [], keys, items, copy) keep dict-based callers working.
+    """
+    id: Optional[str] = None
+    title: Optional[str] = None
+    url: Optional[str] = None
+    posted_date_relative: Optional[str] = None
+    posted_date_timestamp: Optional[datetime] = None
+    bids_count: Optional[int] = None
+    description: Optional[str] = None
+    budget: Optional[str] = None
+    budget_min: Optional[float] = None  # parse_budget gives ints, the REAL columns read back as floats
+    budget_max: Optional[float] = None
+    budget_type: Optional[str] = None
+    skills: List[str] = field(default_factory=list)
+    is_max_project: bool = False
+    is_featured: bool = False
+    client_name: Optional[str] = None
+    client_country: Optional[str] = None
+    client_rating: Optional[float] = None
+    client_payment_verified: bool = False
+    client_last_reply: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        """Composite key used to compare jobs: id + client_name"""
+        return f"{self.id}|{self.client_name or ''}"
+
+    def to_row(self) -> Tuple:
+        """Values for the JOB_COLUMNS of the jobs table (skills as a JSON list, None if empty)"""
+        return (
+            self.id,
+            self.title,
+            self.description,
+            self.url,
+            self.posted_date_relative,
+            self.posted_date_timestamp,
+            self.bids_count,
+            self.budget,
+            self.budget_min,
+            self.budget_max,
+            self.budget_type,
+            json.dumps(self.skills) if self.skills else None,
+            self.client_name,
+            self.client_country,
+            self.client_rating,
+            self.client_payment_verified,
+            self.client_last_reply,
+            self.is_featured,
+            self.is_max_project,
+        )
+
+    # Dict adapter
+
+    @classmethod
+    def from_dict(cls, data: Dict) -> 'Job':
+        """Build a Job from a job dict (unknown keys are ignored)"""
+        job = cls(**{name: data[name] for name in JOB_FIELDS if name in data})
+        if isinstance(job.skills, str):
+            job.skills = json.loads(job.skills)
+        elif job.skills is None:
+            job.skills = []
+        return job
+
+    def to_dict(self) -> Dict:
+        """Plain dict with the same keys the parsers used to return"""
+        return {name: getattr(self, name) for name in JOB_FIELDS}
+
+    def get(self, name: str, default: Any = None) -> Any:
+        if name in JOB_FIELDS:
+            return getattr(self, name)
+        return default
+
+    def __getitem__(self, name: str) -> Any:
+        if name not in JOB_FIELDS:
+            raise KeyError(name)
+        return getattr(self, name)
+
+    def __setitem__(self, name: str, value: Any):
+        if name not in JOB_FIELDS:
+            raise KeyError(name)
+        setattr(self, name, value)
+
+    def __contains__(self, name: str) -> bool:
+        return name in JOB_FIELDS
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(JOB_FIELDS)
+
+    def keys(self) -> Tuple[str, ...]:
+        return JOB_FIELDS
+
+    def items(self) -> List[Tuple[str, Any]]:
+        return [(name, getattr(self, name)) for name in JOB_FIELDS]
+
+    def copy(self) -> 'Job':
+        """Shallow copy, like dict.copy()"""
+        return replace(self)
+
+
+JOB_FIELDS = tuple(job_field.name for job_field in fields(Job))
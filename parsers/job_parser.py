@@ -1,14 +1,26 @@
 """
 Parser for extracting job data from HTML elements
 """
+import os
 import re
-from typing import Dict, Optional, List
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, List, Union
 from bs4 import BeautifulSoup
 from config.selectors import SELECTORS
+from config.settings import PARSE_WORKERS, PARSE_POOL_MIN_CARDS
 from parsers.date_parser import parse_relative_date, extract_job_id_from_url
+from parsers.job import Job
 
 
-def parse_budget(budget_text: str) -> Dict[str, Optional[str]]:
+# Bump whenever parsing output changes (build_job_data, extract_job_fields, parse_budget...):
+# parse cache files saved by another version are discarded on load
+PARSER_VERSION = 1
+
+
+def parse_budget(budget_text: str) -> Dict[str, Optional[Union[int, str]]]:
     """
     Parse budget text to extract min, max, and type
     Examples:
@@ -219,164 +231,291 @@ def parse_job_element(job_element, base_url: str = "https://www.workana.com") ->
     return job_data
 
 
-def parse_job_element_from_html(html: str, base_url: str = "https://www.workana.com") -> Dict:
+def build_job_data(fields: Dict, base_url: str = "https://www.workana.com") -> Job:
     """
-    Parse a single job element from HTML string (avoids stale element issues)
-    Returns dictionary with job data
+    Build the Job record from raw card fields.
+    
+    `fields` holds the stripped text/attribute values found in a card (None when
+    the element is missing), so every extraction engine produces identical output:
+    - title, href, date, bids, description, budget: text or None
+    - skills: list of skill texts
+    - has_max_badge, is_featured, has_author, payment_verified: booleans
+    - client_name, client_country, rating_title, last_reply: text or None
     """
-    job_data = {}
+    job = Job()
     
     try:
-        soup = BeautifulSoup(html, 'lxml')
-        
         # Title and URL
-        title_elem = soup.select_one(SELECTORS['job_title'])
-        if title_elem:
-            job_data['title'] = title_elem.get_text(strip=True)
-            url_path = title_elem.get('href', '')
+        if fields.get('title') is not None:
+            job.title = fields['title']
+            url_path = fields.get('href') or ''
             if url_path:
                 if url_path.startswith('http'):
-                    job_data['url'] = url_path
+                    job.url = url_path
                 else:
-                    job_data['url'] = base_url + url_path
-                job_data['id'] = extract_job_id_from_url(job_data['url'])
+                    job.url = base_url + url_path
+                job.id = extract_job_id_from_url(job.url)
             else:
-                job_data['url'] = None
-                job_data['id'] = None
+                job.url = None
+                job.id = None
         else:
-            job_data['title'] = None
-            job_data['url'] = None
-            job_data['id'] = None
+            job.title = None
+            job.url = None
+            job.id = None
         
         # Date
-        date_elem = soup.select_one(SELECTORS['job_date'])
-        if date_elem:
-            date_text = date_elem.get_text(strip=True)
-            job_data['posted_date_relative'] = date_text.replace('Published: ', '').strip() if date_text else None
-            job_data['posted_date_timestamp'] = parse_relative_date(job_data['posted_date_relative']) if job_data['posted_date_relative'] else None
-        else:
-            job_data['posted_date_relative'] = None
-            job_data['posted_date_timestamp'] = None
+        date_text = fields.get('date')
+        job.posted_date_relative = date_text.replace('Published: ', '').strip() if date_text else None
+        job.posted_date_timestamp = parse_relative_date(job.posted_date_relative) if job.posted_date_relative else None
         
         # Bids count
-        bids_elem = soup.select_one(SELECTORS['job_bids'])
-        if bids_elem:
-            bids_text = bids_elem.get_text(strip=True)
-            if bids_text:
-                match = re.search(r'(\d+)', bids_text)
-                job_data['bids_count'] = int(match.group(1)) if match else None
-            else:
-                job_data['bids_count'] = None
+        bids_text = fields.get('bids')
+        if bids_text:
+            match = re.search(r'(\d+)', bids_text)
+            job.bids_count = int(match.group(1)) if match else None
         else:
-            job_data['bids_count'] = None
+            job.bids_count = None
         
         # Description
-        desc_elem = soup.select_one(SELECTORS['job_description'])
-        if desc_elem:
-            job_data['description'] = desc_elem.get_text(strip=True)
-        else:
-            job_data['description'] = None
+        job.description = fields.get('description')
         
         # Budget
-        budget_elem = soup.select_one(SELECTORS['job_budget'])
-        if budget_elem:
-            budget_text = budget_elem.get_text(strip=True)
-            job_data['budget'] = budget_text
+        budget_text = fields.get('budget')
+        if budget_text is not None:
+            job.budget = budget_text
             budget_parsed = parse_budget(budget_text)
-            job_data['budget_min'] = budget_parsed['min']
-            job_data['budget_max'] = budget_parsed['max']
-            job_data['budget_type'] = budget_parsed['type']
+            job.budget_min = budget_parsed['min']
+            job.budget_max = budget_parsed['max']
+            job.budget_type = budget_parsed['type']
         else:
-            job_data['budget'] = None
-            job_data['budget_min'] = None
-            job_data['budget_max'] = None
-            job_data['budget_type'] = None
+            job.budget = None
+            job.budget_min = None
+            job.budget_max = None
+            job.budget_type = None
         
         # Skills
-        skill_elems = soup.select(SELECTORS['job_skills'])
-        job_data['skills'] = [skill.get_text(strip=True) for skill in skill_elems if skill.get_text(strip=True)]
+        job.skills = [skill for skill in (fields.get('skills') or []) if skill]
         
         # Featured/Max project
-        featured_badge = soup.select_one(SELECTORS['job_featured_badge'])
-        job_data['is_max_project'] = featured_badge is not None
-        
-        # Check if featured (has project-item-featured class)
-        main_elem = soup.select_one('.project-item')
-        classes = main_elem.get('class', []) if main_elem else []
-        job_data['is_featured'] = 'project-item-featured' in classes
+        job.is_max_project = bool(fields.get('has_max_badge'))
+        job.is_featured = bool(fields.get('is_featured'))
         
         # Client information
-        client_section = soup.select_one('div.project-author')
-        if client_section:
-            # Client name
-            name_elem = client_section.select_one(SELECTORS['client_name'])
-            job_data['client_name'] = name_elem.get_text(strip=True) if name_elem else None
+        if fields.get('has_author'):
+            job.client_name = fields.get('client_name')
+            job.client_country = fields.get('client_country')
             
-            # Client country - get text from anchor tag inside country-name span
-            country_elem = client_section.select_one(SELECTORS['client_country'])
-            if country_elem:
-                job_data['client_country'] = country_elem.get_text(strip=True)
+            # Client rating - extract first number from title like "0.00 of 5.00"
+            rating_title = fields.get('rating_title')
+            if rating_title:
+                match = re.search(r'(\d+\.?\d*)', rating_title)
+                job.client_rating = float(match.group(1)) if match else None
             else:
-                # Fallback 1: try span.country-name > a directly
-                country_elem = client_section.select_one('span.country-name > a')
-                if country_elem:
-                    job_data['client_country'] = country_elem.get_text(strip=True)
-                else:
-                    # Fallback 2: try span.country > a
-                    country_elem = client_section.select_one('span.country > a')
-                    job_data['client_country'] = country_elem.get_text(strip=True) if country_elem else None
+                job.client_rating = None
             
-            # Client rating - get from title attribute of stars-bg element
-            rating_elem = client_section.select_one(SELECTORS['client_rating'])
-            if rating_elem:
-                title_attr = rating_elem.get('title', '')
-                if title_attr:
-                    # Extract first number from title like "0.00 of 5.00"
-                    match = re.search(r'(\d+\.?\d*)', title_attr)
-                    job_data['client_rating'] = float(match.group(1)) if match else None
-                else:
-                    job_data['client_rating'] = None
-            else:
-                # Fallback: try to find stars-bg inside profile-stars
-                profile_stars = client_section.select_one('span.rating > span.profile-stars')
-                if profile_stars:
-                    stars_bg = profile_stars.select_one('span.stars-bg')
-                    if stars_bg:
-                        title_attr = stars_bg.get('title', '')
-                        if title_attr:
-                            match = re.search(r'(\d+\.?\d*)', title_attr)
-                            job_data['client_rating'] = float(match.group(1)) if match else None
-                        else:
-                            job_data['client_rating'] = None
-                    else:
-                        job_data['client_rating'] = None
-                else:
-                    job_data['client_rating'] = None
-            
-            # Payment verified
-            verified_elem = client_section.select_one(SELECTORS['client_payment_verified'])
-            job_data['client_payment_verified'] = verified_elem is not None
+            job.client_payment_verified = bool(fields.get('payment_verified'))
             
-            # Last reply
-            reply_elem = client_section.select_one(SELECTORS['client_last_reply'])
-            if reply_elem:
-                reply_text = reply_elem.get_text(strip=True)
-                if reply_text:
-                    parts = reply_text.split(':', 1)
-                    job_data['client_last_reply'] = parts[-1].strip() if len(parts) > 1 else reply_text
-                else:
-                    job_data['client_last_reply'] = None
+            # Last reply - keep just the time part (after "Last reply:")
+            reply_text = fields.get('last_reply')
+            if reply_text:
+                parts = reply_text.split(':', 1)
+                job.client_last_reply = parts[-1].strip() if len(parts) > 1 else reply_text
             else:
-                job_data['client_last_reply'] = None
+                job.client_last_reply = None
         else:
-            job_data['client_name'] = None
-            job_data['client_country'] = None
-            job_data['client_rating'] = None
-            job_data['client_payment_verified'] = False
-            job_data['client_last_reply'] = None
+            job.client_name = None
+            job.client_country = None
+            job.client_rating = None
+            job.client_payment_verified = False
+            job.client_last_reply = None
     
+    except Exception as e:
+        print(f"Error building job data: {e}")
+    
+    return job
+
+
+def extract_job_fields(soup) -> Dict:
+    """Collect raw card fields from a BeautifulSoup card tree (see build_job_data)"""
+    def text_of(elem):
+        return elem.get_text(strip=True) if elem else None
+    
+    fields = {}
+    
+    # Title and URL
+    title_elem = soup.select_one(SELECTORS['job_title'])
+    fields['title'] = text_of(title_elem)
+    fields['href'] = title_elem.get('href', '') if title_elem else None
+    
+    fields['date'] = text_of(soup.select_one(SELECTORS['job_date']))
+    fields['bids'] = text_of(soup.select_one(SELECTORS['job_bids']))
+    fields['description'] = text_of(soup.select_one(SELECTORS['job_description']))
+    fields['budget'] = text_of(soup.select_one(SELECTORS['job_budget']))
+    fields['skills'] = [skill.get_text(strip=True) for skill in soup.select(SELECTORS['job_skills'])]
+    
+    # Featured/Max project
+    fields['has_max_badge'] = soup.select_one(SELECTORS['job_featured_badge']) is not None
+    
+    # Check if featured (has project-item-featured class)
+    main_elem = soup.select_one('.project-item')
+    classes = main_elem.get('class', []) if main_elem else []
+    fields['is_featured'] = 'project-item-featured' in classes
+    
+    # Client information
+    client_section = soup.select_one('div.project-author')
+    fields['has_author'] = client_section is not None
+    if client_section:
+        fields['client_name'] = text_of(client_section.select_one(SELECTORS['client_name']))
+        
+        # Client country - anchor inside country-name span, with fallbacks
+        country_elem = (
+            client_section.select_one(SELECTORS['client_country'])
+            or client_section.select_one('span.country-name > a')
+            or client_section.select_one('span.country > a')
+        )
+        fields['client_country'] = text_of(country_elem)
+        
+        # Client rating - title attribute of stars-bg element
+        rating_elem = client_section.select_one(SELECTORS['client_rating'])
+        if not rating_elem:
+            profile_stars = client_section.select_one('span.rating > span.profile-stars')
+            rating_elem = profile_stars.select_one('span.stars-bg') if profile_stars else None
+        fields['rating_title'] = rating_elem.get('title', '') if rating_elem else None
+        
+        fields['payment_verified'] = client_section.select_one(SELECTORS['client_payment_verified']) is not None
+        fields['last_reply'] = text_of(client_section.select_one(SELECTORS['client_last_reply']))
+    
+    return fields
+
+
+def parse_job_element_from_html(html: str, base_url: str = "https://www.workana.com") -> Job:
+    """
+    Parse a single job element from HTML string (avoids stale element issues)
+    Returns Job record (an empty Job without an ID if parsing fails)
+    """
+    try:
+        soup = BeautifulSoup(html, 'lxml')
+        fields = extract_job_fields(soup)
     except Exception as e:
         print(f"Error parsing job HTML: {e}")
+        return Job()
     
-    return job_data
+    return build_job_data(fields, base_url)
+
 
+# Process pool shared by parse_jobs_batch calls (created on first large batch)
+_parse_pool = None
+_parse_pool_workers = 0
+
+
+def _parse_chunk(htmls: List[str], base_url: str) -> List[Job]:
+    """Parse a chunk of card HTML strings; a failing card yields an empty Job without affecting the others"""
+    jobs = []
+    for html in htmls:
+        try:
+            jobs.append(parse_job_element_from_html(html, base_url))
+        except Exception as e:
+            print(f"Error parsing job HTML: {e}")
+            jobs.append(Job())
+    return jobs
+
+
+def _get_parse_pool(workers: int) -> ProcessPoolExecutor:
+    """Return the shared process pool, recreating it if the worker count changed"""
+    global _parse_pool, _parse_pool_workers
+    if _parse_pool is None or _parse_pool_workers != workers:
+        shutdown_parse_pool()
+        # forkserver: forking the scraper itself would copy the locks of its asyncio and delivery threads
+        _parse_pool = ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context("forkserver"))
+        _parse_pool_workers = workers
+    return _parse_pool
+
+
+def shutdown_parse_pool():
+    """Stop the worker processes of parse_jobs_batch"""
+    global _parse_pool, _parse_pool_workers
+    if _parse_pool is not None:
+        _parse_pool.shutdown(cancel_futures=True)
+        _parse_pool = None
+        _parse_pool_workers = 0
+
+
+def _submit_batch(htmls: List[str], base_url: str, workers: int = None) -> Optional[tuple]:
+    """
+    Split a batch into chunks and submit them to the process pool.
+    Returns (chunks, futures), or None if the batch should be parsed in-process
+    (small batch, single worker or pool unavailable).
+    """
+    workers = workers or PARSE_WORKERS or os.cpu_count() or 1
+    # Give every worker at least half a minimum batch, so small batches don't start idle workers
+    workers = min(workers, max(len(htmls) // max(PARSE_POOL_MIN_CARDS // 2, 1), 1))
+    if workers <= 1 or len(htmls) < PARSE_POOL_MIN_CARDS:
+        return None
+    
+    # About four chunks per worker keeps workers busy without too much pickling overhead
+    chunk_size = -(-len(htmls) // (workers * 4))
+    chunks = [htmls[i:i + chunk_size] for i in range(0, len(htmls), chunk_size)]
+    
+    try:
+        pool = _get_parse_pool(workers)
+        return chunks, [pool.submit(_parse_chunk, chunk, base_url) for chunk in chunks]
+    except (BrokenProcessPool, OSError, RuntimeError) as e:
+        print(f"⚠️  Parse pool unavailable ({e}), parsing in-process")
+        shutdown_parse_pool()
+        return None
+
+
+def _chunk_failed(chunk: List[str], base_url: str, error: Exception) -> List[Job]:
+    """Re-parse a chunk whose worker failed in-process"""
+    print(f"⚠️  Parse worker failed ({error}), re-parsing {len(chunk)} card(s) in-process")
+    if isinstance(error, BrokenProcessPool):
+        shutdown_parse_pool()
+    return _parse_chunk(chunk, base_url)
+
+
+def parse_jobs_batch(htmls: List[str], base_url: str = "https://www.workana.com",
+                     workers: int = None) -> List[Job]:
+    """
+    Parse many job card HTML strings, in input order.
+    Large batches are split into chunks and parsed in a process pool; batches
+    smaller than PARSE_POOL_MIN_CARDS (or with a single worker) stay in-process.
+    A card that fails to parse yields an empty Job, and a chunk whose worker fails is
+    re-parsed in-process, so one bad card never loses the rest of the batch.
+    
+    Args:
+        htmls: Card HTML strings
+        base_url: Base URL for relative job links
+        workers: Worker processes (default PARSE_WORKERS, or the number of CPUs)
+    """
+    htmls = list(htmls)
+    submitted = _submit_batch(htmls, base_url, workers)
+    if submitted is None:
+        return _parse_chunk(htmls, base_url)
+    
+    jobs = []
+    for chunk, future in zip(*submitted):
+        try:
+            jobs.extend(future.result())
+        except Exception as e:
+            jobs.extend(_chunk_failed(chunk, base_url, e))
+    return jobs
+
+
+async def parse_jobs_batch_async(htmls: List[str], base_url: str = "https://www.workana.com",
+                                 workers: int = None) -> List[Job]:
+    """
+    parse_jobs_batch for the event loop: awaits the pool's chunks instead of blocking on them.
+    Batches parsed in-process (see parse_jobs_batch) still run inline, as they are small.
+    """
+    htmls = list(htmls)
+    submitted = _submit_batch(htmls, base_url, workers)
+    if submitted is None:
+        return _parse_chunk(htmls, base_url)
+    
+    jobs = []
+    for chunk, future in zip(*submitted):
+        try:
+            jobs.extend(await asyncio.wrap_future(future))
+        except Exception as e:
+            jobs.extend(_chunk_failed(chunk, base_url, e))
+    return jobs
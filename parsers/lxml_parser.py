@@ -0,0 +1,186 @@
+"""
+Whole-page job card extraction with lxml.
+
+The listing (or just the #projects container) is parsed once, and every
+card is read from that single tree with XPath expressions compiled once at
+import from SELECTORS and the parser's hard-coded fallbacks. Each card
+becomes a raw field record for build_job_data (the same records the
+in-browser extractor produces, see parse_job_record), so the output matches
+parse_job_element_from_html exactly.
+"""
+from typing import Dict, List, Optional, Tuple
+from cssselect import GenericTranslator
+from lxml import etree, html as lxml_html
+
+from config.selectors import SELECTORS
+from parsers.browser_extractor import parse_job_record
+from parsers.job import Job
+
+
+_translator = GenericTranslator()
+
+
+def compile_selector(css: str, prefix: str = 'descendant-or-self::') -> etree.XPath:
+    """Compile a CSS selector to an XPath evaluated relative to a context element"""
+    return etree.XPath(_translator.css_to_xpath(css, prefix=prefix))
+
+
+# Every selector in SELECTORS, compiled once
+XPATHS = {name: compile_selector(css) for name, css in SELECTORS.items()}
+
+# Fallbacks used by extract_job_fields
+XPATH_CLIENT_SECTION = compile_selector('div.project-author')
+XPATH_COUNTRY_FALLBACKS = [
+    compile_selector('span.country-name > a'),
+    compile_selector('span.country > a'),
+]
+XPATH_PROFILE_STARS = compile_selector('span.rating > span.profile-stars')
+XPATH_STARS_BG = compile_selector('span.stars-bg', prefix='descendant::')
+
+# get_text() ignores text inside these elements
+_SKIPPED_TAGS = {'script', 'style', 'template'}
+
+
+def text_of(element) -> Optional[str]:
+    """Same result as BeautifulSoup's get_text(strip=True): stripped text nodes joined without separator"""
+    if element is None:
+        return None
+    parts = []
+    for node in element.iter():
+        is_element = isinstance(node.tag, str)
+        # Text directly inside the node (comments and processing instructions are not text)
+        if is_element and node.tag not in _SKIPPED_TAGS and node.text:
+            value = node.text.strip()
+            if value:
+                parts.append(value)
+        # Text following the node belongs to its parent
+        if node is not element and node.tail:
+            parent = node.getparent()
+            if parent is None or parent.tag not in _SKIPPED_TAGS:
+                value = node.tail.strip()
+                if value:
+                    parts.append(value)
+    return ''.join(parts)
+
+
+def first(xpath: etree.XPath, context):
+    """First match of a compiled selector in document order (like select_one), or None"""
+    matches = xpath(context)
+    return matches[0] if matches else None
+
+
+def extract_card_fields(card) -> Dict:
+    """Collect raw card fields from an lxml card element (see build_job_data)"""
+    fields = {}
+
+    # Title and URL
+    title_elem = first(XPATHS['job_title'], card)
+    fields['title'] = text_of(title_elem)
+    fields['href'] = title_elem.get('href', '') if title_elem is not None else None
+
+    fields['date'] = text_of(first(XPATHS['job_date'], card))
+    fields['bids'] = text_of(first(XPATHS['job_bids'], card))
+    fields['description'] = text_of(first(XPATHS['job_description'], card))
+    fields['budget'] = text_of(first(XPATHS['job_budget'], card))
+    fields['skills'] = [text_of(skill) for skill in XPATHS['job_skills'](card)]
+
+    # Featured/Max project
+    fields['has_max_badge'] = first(XPATHS['job_featured_badge'], card) is not None
+    fields['is_featured'] = 'project-item-featured' in (card.get('class') or '').split()
+
+    # Client information
+    client_section = first(XPATH_CLIENT_SECTION, card)
+    fields['has_author'] = client_section is not None
+    if client_section is not None:
+        fields['client_name'] = text_of(first(XPATHS['client_name'], client_section))
+
+        # Client country - anchor inside country-name span, with fallbacks
+        country_elem = first(XPATHS['client_country'], client_section)
+        for xpath in XPATH_COUNTRY_FALLBACKS:
+            if country_elem is not None:
+                break
+            country_elem = first(xpath, client_section)
+        fields['client_country'] = text_of(country_elem)
+
+        # Client rating - title attribute of stars-bg element
+        rating_elem = first(XPATHS['client_rating'], client_section)
+        if rating_elem is None:
+            profile_stars = first(XPATH_PROFILE_STARS, client_section)
+            rating_elem = first(XPATH_STARS_BG, profile_stars) if profile_stars is not None else None
+        fields['rating_title'] = rating_elem.get('title', '') if rating_elem is not None else None
+
+        fields['payment_verified'] = first(XPATHS['client_payment_verified'], client_section) is not None
+        fields['last_reply'] = text_of(first(XPATHS['client_last_reply'], client_section))
+
+    return fields
+
+
+def parse_listing_tree(html: str):
+    """Parse a listing page, or just the #projects container, into one lxml tree"""
+    return lxml_html.document_fromstring(html)
+
+
+def extract_listing_records(tree, parse_cache=None) -> Optional[List[Dict]]:
+    """
+    Extract one raw field record per job card in the #projects container.
+    Cards that fail come back as {'error': ..., 'html': ...} (see parse_job_record).
+    With a ParseCache, each card is looked up by a digest of its serialized element
+    first: hits come back as {'job': Job} without extracting any field, misses carry
+    the digest as 'cache_key' so the built Job can be stored.
+    Returns None if the page has no jobs container.
+    """
+    container = first(XPATHS['job_container'], tree)
+    if container is None:
+        return None
+
+    use_cache = parse_cache is not None and parse_cache.max_size
+    records = []
+    for card in XPATHS['job_item'](container):
+        try:
+            if use_cache:
+                digest = parse_cache.key(etree.tostring(card))
+                job = parse_cache.get_digest(digest)
+                if job is not None:
+                    records.append({'job': job})
+                    continue
+                record = extract_card_fields(card)
+                record['cache_key'] = digest
+                records.append(record)
+            else:
+                records.append(extract_card_fields(card))
+        except Exception as e:
+            records.append({'error': str(e), 'html': lxml_html.tostring(card, encoding='unicode')})
+    return records
+
+
+def get_total_pages(tree) -> int:
+    """Get total number of pages from pagination"""
+    pagination = first(XPATHS['pagination'], tree)
+    if pagination is None:
+        return 1
+
+    page_numbers = []
+    for link in XPATHS['pagination_pages'](pagination):
+        text = text_of(link)
+        if text.isdigit():
+            page_numbers.append(int(text))
+
+    return max(page_numbers) if page_numbers else 1
+
+
+def parse_listing(html: str, parse_cache=None) -> Optional[Tuple[List[Dict], int]]:
+    """
+    Parse a listing page once and return (card records, total pages),
+    or None if it has no jobs container or no job cards.
+    """
+    tree = parse_listing_tree(html)
+    records = extract_listing_records(tree, parse_cache)
+    if not records:
+        return None
+    return records, get_total_pages(tree)
+
+
+def parse_jobs_from_listing(html: str, base_url: str = "https://www.workana.com") -> List[Job]:
+    """Parse every job card on a listing page (or #projects container HTML) into Jobs"""
+    records = extract_listing_records(parse_listing_tree(html)) or []
+    return [parse_job_record(record, base_url) for record in records]
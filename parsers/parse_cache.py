@@ -0,0 +1,119 @@
+"""
+LRU cache of parsed job cards keyed by a digest of the card HTML
+"""
+import json
+import hashlib
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional, Union
+
+from config.settings import PARSE_CACHE_SIZE
+from parsers.date_parser import parse_relative_date
+from parsers.job import Job
+from parsers.job_parser import PARSER_VERSION
+
+
+class ParseCache:
+    """
+    Bounded LRU cache of parsed job cards.
+    The same cards come back byte-for-byte identical every cycle, so a hit
+    returns a copy of the stored job data with only the time-dependent
+    posted_date_timestamp recomputed from posted_date_relative.
+    Keys are digests of the card HTML string (html engine) or of the serialized
+    lxml card element (lxml engine, looked up before the card's fields are extracted).
+    The saved file records PARSER_VERSION; entries from another parser version are dropped.
+    Safe to share between the HTTP fetch thread and the event loop.
+    """
+
+    def __init__(self, max_size: int = None, path: Optional[Path] = None):
+        """
+        Initialize cache
+
+        Args:
+            max_size: Maximum number of cached cards (0 disables the cache)
+            path: JSON file the cache is loaded from and saved to (None = memory only)
+        """
+        self.max_size = PARSE_CACHE_SIZE if max_size is None else max_size
+        self.path = Path(path) if path else None
+        self.entries = OrderedDict()  # digest -> job dict without posted_date_timestamp
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(html: Union[str, bytes]) -> str:
+        """Digest of a card's HTML (text, or bytes as serialized by lxml)"""
+        if isinstance(html, str):
+            html = html.encode('utf-8')
+        return hashlib.blake2b(html, digest_size=16).hexdigest()
+
+    def get(self, html: Union[str, bytes]) -> Optional[Job]:
+        """Return the cached Job for a card (with a fresh timestamp), or None on a miss"""
+        if not self.max_size:
+            return None
+        return self.get_digest(self.key(html))
+
+    def get_digest(self, digest: str) -> Optional[Job]:
+        """get() for a precomputed key"""
+        with self.lock:
+            cached = self.entries.get(digest)
+            if cached is None:
+                return None
+            self.entries.move_to_end(digest)
+
+        job = Job.from_dict(cached)
+        job.skills = list(job.skills)
+        if job.posted_date_relative:
+            job.posted_date_timestamp = parse_relative_date(job.posted_date_relative)
+        return job
+
+    def put(self, html: Union[str, bytes], job: Job):
+        """Store a card's parsed Job (failed parses without an ID are not cached)"""
+        if self.max_size:
+            self.put_digest(self.key(html), job)
+
+    def put_digest(self, digest: str, job: Job):
+        """put() for a precomputed key"""
+        if not self.max_size or not job.id:
+            return
+
+        entry = job.to_dict()
+        del entry['posted_date_timestamp']
+        with self.lock:
+            self.entries[digest] = entry
+            self.entries.move_to_end(digest)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+
+    def load(self) -> int:
+        """Load saved entries from disk; returns the number of entries loaded"""
+        if not self.max_size or not self.path or not self.path.exists():
+            return 0
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                saved = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  Could not load parse cache: {e}")
+            return 0
+        
+        # Entries parsed by another parser version may be wrong now
+        if not isinstance(saved, dict) or saved.get('version') != PARSER_VERSION:
+            print("ℹ️  Parse cache was saved by another parser version, discarding it")
+            return 0
+        entries = saved.get('entries') or {}
+
+        # Oldest first, so the most recently used entries survive the size limit
+        for digest, job_data in list(entries.items())[-self.max_size:]:
+            self.entries[digest] = job_data
+        return len(self.entries)
+
+    def save(self):
+        """Save entries to disk (least recently used first)"""
+        if not self.max_size or not self.path:
+            return
+        try:
+            with self.lock:
+                entries = dict(self.entries)
+            with open(self.path, 'w', encoding='utf-8') as f:
+                json.dump({'version': PARSER_VERSION, 'entries': entries}, f, ensure_ascii=False)
+        except OSError as e:
+            print(f"⚠️  Could not save parse cache: {e}")
@@ -0,0 +1,1187 @@
+"""
+Asyncio Playwright-based scraper for Workana job listings
+"""
+import re
+import time
+import asyncio
+import random
+import hashlib
+from typing import AsyncIterator, List, Dict, Optional, Set
+from urllib.parse import quote
+from playwright.async_api import async_playwright, Browser, Page, TimeoutError as PlaywrightTimeoutError
+
+from config.settings import (
+    BASE_URL, JOBS_URL, DEFAULT_CATEGORY, DEFAULT_LANGUAGE,
+    HEADLESS, PAGE_LOAD_TIMEOUT, EXPLICIT_WAIT_TIMEOUT, READINESS_QUIET_MS, READINESS_MAX_WAIT,
+    DELAY_BETWEEN_REQUESTS, RANDOM_DELAY_RANGE, MAX_PAGES, STOP_ON_KNOWN_JOB,
+    INCREMENTAL_CRAWL, INCREMENTAL_KNOWN_RUN,
+    ADAPTIVE_RATE, USER_AGENT, BROWSER, CONCURRENT_PAGES, CONCURRENT_REQUEST_INTERVAL,
+    EXTRACTION_ENGINE, FETCH_MODE, PARSE_POOL_MIN_CARDS, PARSE_CACHE_PATH, PIPELINE_PAGES, SKIP_UNCHANGED_LISTING,
+    BROWSER_ENDPOINT, BROWSER_ENDPOINT_TYPE, BROWSER_CONNECT_TIMEOUT, STORAGE_STATE_PATH,
+    RECYCLE_PAGE_RENDERER_MB, RECYCLE_CONTEXT_NAVIGATIONS, RECYCLE_BROWSER_TOTAL_MB, BLOCK_RESOURCES, BLOCKED_URL_PATTERNS
+)
+from config.selectors import SELECTORS
+from parsers.job import Job
+from parsers.job_parser import parse_job_element_from_html, parse_jobs_batch_async, shutdown_parse_pool
+from parsers.date_parser import extract_job_id_from_url, parse_relative_dates
+from parsers.browser_extractor import extract_job_records_async, parse_job_record
+from parsers.lxml_parser import parse_listing_tree, extract_listing_records
+from parsers.parse_cache import ParseCache
+from scrapers.http_fetcher import HttpListingFetcher
+from scrapers.rate_limiter import AimdRateLimiter, is_challenge_page
+
+
+# Job slug in a card's title link (used to fingerprint a listing without parsing it)
+JOB_HREF_PATTERN = re.compile(r'href="(?:https?://www\.workana\.com)?/job/([^/?"]+)')
+
+# Readiness predicate: jobs container present, card count stable and no DOM mutations
+# inside it for `quietMs` (state resets on every navigation). Cards are server-rendered
+# into the container, so an empty listing resolves after the quiet window as well.
+PAGE_READY_JS = """
+({containerSelector, itemSelector, quietMs}) => {
+    const container = document.querySelector(containerSelector);
+    if (!container) return false;
+    const state = window.__scraperReadiness || (window.__scraperReadiness = {target: null, observer: null, last: 0, count: -1});
+    if (state.target !== container) {
+        if (state.observer) state.observer.disconnect();
+        state.observer = new MutationObserver(() => { state.last = performance.now(); });
+        state.observer.observe(container, {childList: true, subtree: true, attributes: true, characterData: true});
+        state.target = container;
+        state.last = performance.now();
+    }
+    const count = container.querySelectorAll(itemSelector).length;
+    if (count !== state.count) {
+        state.count = count;
+        state.last = performance.now();
+    }
+    return performance.now() - state.last >= quietMs;
+}
+"""
+
+# Scroll to the bottom and restart the readiness quiet window (see PAGE_READY_JS)
+SCROLL_TO_BOTTOM_JS = """
+() => {
+    window.scrollTo(0, document.body.scrollHeight);
+    if (window.__scraperReadiness) window.__scraperReadiness.last = performance.now();
+}
+"""
+
+
+class AsyncWorkanaScraper:
+    """
+    Asyncio Playwright-based scraper for Workana job listings.
+    Browser calls await on the event loop, so other coroutines (delivery,
+    housekeeping) keep running while pages load.
+    """
+    
+    def __init__(self, headless: bool = None, concurrent_pages: int = None, extraction_engine: str = None,
+                 fetch_mode: str = None, pipeline_pages: bool = None):
+        self.headless = headless if headless is not None else HEADLESS
+        self.concurrent_pages = concurrent_pages if concurrent_pages is not None else CONCURRENT_PAGES
+        self.extraction_engine = extraction_engine or EXTRACTION_ENGINE
+        self.fetch_mode = fetch_mode or FETCH_MODE
+        self.pipeline_pages = pipeline_pages if pipeline_pages is not None else PIPELINE_PAGES
+        self.http_fetcher = None
+        self.playwright = None
+        self.browser = None
+        self.context = None
+        self.page = None
+        self.page_pool = []  # Extra pages used by concurrent mode (self.page is always the first)
+        self.browser_source = None  # "connected" (long-lived browser) or "launched"
+        self.startup_seconds = None
+        self.context_navigations = 0  # Page loads in the current context (memory watchdog)
+        self.base_url = BASE_URL
+        self._last_request_at = 0.0
+        self._request_lock = asyncio.Lock()
+        self.readiness_log = []  # Per-page readiness records for the current cycle
+        self.feed_key = None  # (category, language) of the feed being scraped
+        self.last_fingerprints = {}  # Fingerprint of the last fully processed listing, per feed
+        self.pending_fingerprint = None  # Fingerprint of the current cycle, confirmed by mark_cycle_processed
+        self.skip_job_ids = set()  # Job IDs already scraped by another feed this round (skipped before parsing)
+        self.cycle_unchanged = False
+        self.crawl_state = {}  # Incremental crawl progress for the current cycle (see reset_crawl_state)
+        # AIMD controller for the delay between page loads (kept across cycles)
+        self.rate_limiter = AimdRateLimiter(
+            initial_delay=DELAY_BETWEEN_REQUESTS + sum(RANDOM_DELAY_RANGE) / 2
+        ) if ADAPTIVE_RATE else None
+        # Parsed HTML cards, reused while the same cards keep coming back (kept across cycles)
+        self.parse_cache = ParseCache(path=PARSE_CACHE_PATH)
+        self.parse_cache.load()
+        self.metrics = {}
+        self.reset_metrics()
+    
+    def reset_metrics(self):
+        """Reset per-cycle counters (called at the start of each scrape)"""
+        self.metrics = {
+            'extraction_calls': 0,
+            'extraction_seconds': 0.0,
+            'cards_extracted': 0,
+            'browser_fallbacks': 0,
+            'pages_http': 0,
+            'pages_browser': 0,
+            'http_fallbacks': 0,
+            'http_seconds': 0.0,
+            'browser_seconds': 0.0,
+            'blocked_requests': 0,
+            'bytes_received': 0,
+            'readiness_seconds': 0.0,
+            'readiness_timeouts': 0,
+            'duplicates_skipped': 0,
+            'rate_delay': self.rate_limiter.delay if self.rate_limiter else 0.0,
+            'rate_backoffs': 0,
+            'parse_cache_hits': 0,
+            'parse_cache_misses': 0,
+        }
+        self.readiness_log = []
+    
+    def format_metrics(self) -> str:
+        """Format per-cycle counters as a single log line"""
+        parts = []
+        for key, value in self.metrics.items():
+            if isinstance(value, float):
+                parts.append(f"{key}={value:.3f}")
+            else:
+                parts.append(f"{key}={value}")
+        return " | ".join(parts)
+    
+    def reset_crawl_state(self, high_water_mark: Optional[str] = None):
+        """
+        Reset incremental crawl progress for a new cycle.
+        high_water_mark is the newest non-featured job ID seen by the last cycle.
+        """
+        self.crawl_state = {
+            'high_water_mark': high_water_mark,
+            'passed_high_water_mark': False,
+            'known_run': 0,  # Consecutive known non-featured jobs
+            'position': 0,  # Position of the next card in the whole listing
+            'newest_job': None,  # (job ID, position) of the newest non-featured job this cycle
+            'stop_reason': None,  # Rule that ended pagination: "known_job", "incremental" or "unchanged"
+        }
+    
+    def track_duplicate(self, job_id: str):
+        """
+        Update incremental crawl progress with a card skipped as a duplicate of another feed.
+        The card is not parsed, so it can't become the newest job of this feed.
+        """
+        state = self.crawl_state
+        state['position'] += 1
+        if job_id == state['high_water_mark']:
+            state['passed_high_water_mark'] = True
+    
+    def track_incremental(self, job: Job, is_known: bool) -> bool:
+        """
+        Update incremental crawl progress with one parsed job (in listing order).
+        Returns True when pagination can stop after the current page.
+        """
+        state = self.crawl_state
+        position = state['position']
+        state['position'] += 1
+        
+        # Featured/max projects are pinned at the top regardless of age
+        if job.is_featured or job.is_max_project:
+            return False
+        
+        if state['newest_job'] is None:
+            state['newest_job'] = (job.id, position)
+        if job.id == state['high_water_mark']:
+            state['passed_high_water_mark'] = True
+        
+        state['known_run'] = state['known_run'] + 1 if is_known else 0
+        
+        if not INCREMENTAL_CRAWL:
+            return False
+        if state['passed_high_water_mark']:
+            return state['known_run'] >= INCREMENTAL_KNOWN_RUN
+        # High-water mark job not seen (removed or never stored): require a longer run
+        return state['known_run'] >= INCREMENTAL_KNOWN_RUN * 2
+    
+    def stop_message(self) -> str:
+        """Log line naming the rule that ended pagination this cycle"""
+        reason = self.crawl_state.get('stop_reason')
+        if reason == "incremental":
+            return "Stopping scrape: incremental crawl reached jobs seen last cycle"
+        if reason == "unchanged":
+            return "Stopping scrape: listing unchanged"
+        return "Stopping scrape: found known job"
+    
+    async def setup_driver(self):
+        """
+        Initialize the fetcher.
+        In "http" fetch mode the browser is only launched on the first fallback.
+        """
+        if self.fetch_mode == "http":
+            self.http_fetcher = HttpListingFetcher(
+                pool_size=max(self.concurrent_pages, 1),
+                extraction_engine=self.extraction_engine,
+                parse_cache=self.parse_cache
+            )
+            return
+        await self.launch_browser()
+    
+    def browser_ready(self) -> bool:
+        """True when the browser is connected and the shared context and page exist"""
+        return bool(self.browser and self.browser.is_connected() and self.context and self.page)
+    
+    async def ensure_browser(self) -> bool:
+        """
+        Launch the browser if it is not running yet, or restore whatever a failed
+        recycle left missing (browser, context or page). Returns False on failure.
+        """
+        if self.browser_ready():
+            return True
+        try:
+            if not (self.browser and self.browser.is_connected()):
+                await self._close_browser()
+                await self.launch_browser()
+            elif not self.context:
+                await self._create_context()
+            else:
+                self.page = await self._new_page()
+            return True
+        except Exception as e:
+            print(f"Error launching browser: {e}")
+            return False
+    
+    async def launch_browser(self):
+        """
+        Initialize Playwright browser.
+        Connects to BROWSER_ENDPOINT when configured, otherwise (or on failure) launches locally.
+        """
+        start = time.perf_counter()
+        self.playwright = await async_playwright().start()
+        browser_type = getattr(self.playwright, BROWSER)
+        
+        self.browser = await self._connect_browser(browser_type) if BROWSER_ENDPOINT else None
+        if self.browser:
+            self.browser_source = "connected"
+        else:
+            # Launch browser with options
+            self.browser = await browser_type.launch(
+                headless=self.headless,
+                args=[
+                    '--no-sandbox',
+                    '--disable-dev-shm-usage',
+                    '--disable-blink-features=AutomationControlled',
+                    '--disable-extensions',
+                ] if BROWSER == "chromium" else []
+            )
+            self.browser_source = "launched"
+        
+        await self._create_context()
+        
+        self.startup_seconds = time.perf_counter() - start
+        print(f"Browser ready in {self.startup_seconds:.2f}s ({self.browser_source})")
+    
+    async def _connect_browser(self, browser_type) -> Optional[Browser]:
+        """Connect to the long-lived browser at BROWSER_ENDPOINT, or return None if unavailable"""
+        try:
+            if BROWSER_ENDPOINT_TYPE == "cdp":
+                return await self.playwright.chromium.connect_over_cdp(BROWSER_ENDPOINT, timeout=BROWSER_CONNECT_TIMEOUT)
+            return await browser_type.connect(BROWSER_ENDPOINT, timeout=BROWSER_CONNECT_TIMEOUT)
+        except Exception as e:
+            print(f"⚠️  Could not connect to browser at {BROWSER_ENDPOINT}: {e}")
+            print("   Falling back to local browser launch")
+            return None
+    
+    async def _create_context(self):
+        """Create the shared browser context (restoring saved storage state) and its first page"""
+        storage_state = str(STORAGE_STATE_PATH) if STORAGE_STATE_PATH and STORAGE_STATE_PATH.exists() else None
+        
+        # Create new page/context
+        context = await self.browser.new_context(
+            user_agent=USER_AGENT,
+            viewport={'width': 1920, 'height': 1080},
+            storage_state=storage_state
+        )
+        
+        # Non-Chromium browsers block through routes limited to the blocked patterns
+        # (Chromium pages use CDP URL blocking, see _block_resources)
+        if BLOCK_RESOURCES and BROWSER != "chromium":
+            async def abort_route(route):
+                self.metrics['blocked_requests'] += 1
+                await route.abort()
+            
+            for pattern in BLOCKED_URL_PATTERNS:
+                await context.route(pattern.replace('*', '**'), abort_route)
+        
+        self.context = context
+        self.context_navigations = 0
+        self.page = await self._new_page()
+    
+    async def save_storage_state(self):
+        """Save cookies/localStorage of the shared context so the next context starts warm"""
+        if not self.context or not STORAGE_STATE_PATH:
+            return
+        try:
+            await self.context.storage_state(path=str(STORAGE_STATE_PATH))
+        except Exception as e:
+            print(f"⚠️  Could not save browser storage state: {e}")
+    
+    async def _block_resources(self, page: Page):
+        """
+        Block images, fonts, media and trackers natively in Chromium via CDP
+        and count blocked requests and received bytes in the cycle metrics
+        """
+        cdp = await self.context.new_cdp_session(page)
+        await cdp.send('Network.enable')
+        if BLOCK_RESOURCES:
+            await cdp.send('Network.setBlockedURLs', {'urls': BLOCKED_URL_PATTERNS})
+        
+        def on_loading_failed(params):
+            if params.get('blockedReason'):
+                self.metrics['blocked_requests'] += 1
+        
+        def on_loading_finished(params):
+            self.metrics['bytes_received'] += int(params.get('encodedDataLength') or 0)
+        
+        cdp.on('Network.loadingFailed', on_loading_failed)
+        cdp.on('Network.loadingFinished', on_loading_finished)
+    
+    async def _new_page(self) -> Page:
+        """Open a new page in the shared context with timeouts and stealth script applied"""
+        page = await self.context.new_page()
+        
+        if BROWSER == "chromium":
+            await self._block_resources(page)
+        
+        # Set timeouts
+        page.set_default_timeout(PAGE_LOAD_TIMEOUT)
+        
+        # Execute script to hide webdriver property
+        await page.add_init_script("""
+            Object.defineProperty(navigator, 'webdriver', {get: () => undefined});
+        """)
+        return page
+    
+    async def get_page_pool(self, size: int) -> List[Page]:
+        """Return `size` pages from the shared context, opening extra pages as needed"""
+        while len(self.page_pool) < size - 1:
+            self.page_pool.append(await self._new_page())
+        return [self.page] + self.page_pool[:size - 1]
+    
+    async def _wait_for_request_slot(self):
+        """
+        Enforce the global minimum interval between navigation starts (shared by all pages).
+        The AIMD controller can only widen CONCURRENT_REQUEST_INTERVAL, never narrow it.
+        """
+        interval = CONCURRENT_REQUEST_INTERVAL
+        if self.rate_limiter:
+            interval = max(interval, self.rate_limiter.delay)
+        async with self._request_lock:
+            elapsed = time.time() - self._last_request_at
+            if elapsed < interval:
+                await asyncio.sleep(interval - elapsed)
+            self._last_request_at = time.time()
+    
+    def page_delay(self) -> float:
+        """Delay before the next page load (AIMD controller, or static delay plus random jitter)"""
+        if self.rate_limiter:
+            return self.rate_limiter.next_delay()
+        return DELAY_BETWEEN_REQUESTS + random.uniform(*RANDOM_DELAY_RANGE)
+    
+    def record_load(self, seconds: float, status: Optional[int] = None,
+                    timed_out: bool = False, challenged: bool = False):
+        """Feed the outcome of a page load to the rate controller"""
+        if not self.rate_limiter:
+            return
+        if self.rate_limiter.record(seconds, status=status, timed_out=timed_out, challenged=challenged):
+            self.metrics['rate_backoffs'] += 1
+        self.metrics['rate_delay'] = self.rate_limiter.delay
+    
+    def build_jobs_url(self, category: str = None, language: str = None, page: int = 1) -> str:
+        """Build jobs URL with parameters"""
+        category = category or DEFAULT_CATEGORY
+        language = language or DEFAULT_LANGUAGE
+        
+        # URL-encode the language parameter (handles commas and special chars)
+        language_encoded = quote(language, safe='')
+        
+        url = f"{JOBS_URL}?category={category}&language={language_encoded}&publication=1d"
+        if page > 1:
+            url += f"&page={page}"
+        
+        return url
+    
+    async def load_page(self, url: str, page: Page = None, throttle: bool = False) -> bool:
+        """
+        Load a page and wait for jobs to appear.
+        throttle: wait for the global politeness slot first (used when loading pages concurrently)
+        """
+        page = page or self.page
+        if throttle:
+            await self._wait_for_request_slot()
+        start = time.perf_counter()
+        status = None
+        timed_out = False
+        loaded = False
+        try:
+            self.context_navigations += 1
+            response = await page.goto(url, wait_until="domcontentloaded", timeout=PAGE_LOAD_TIMEOUT)
+            status = response.status if response else None
+            await self.wait_for_jobs(page)
+            self.metrics['pages_browser'] += 1
+            loaded = True
+        except PlaywrightTimeoutError:
+            timed_out = True
+            print(f"Timeout loading page: {url}")
+        except Exception as e:
+            print(f"Error loading page {url}: {e}")
+        
+        elapsed = time.perf_counter() - start
+        self.metrics['browser_seconds'] += elapsed
+        challenged = not loaded and await self.is_challenge(page)
+        self.record_load(elapsed, status=status, timed_out=timed_out, challenged=challenged)
+        return loaded
+    
+    async def is_challenge(self, page: Page) -> bool:
+        """Check if a page that failed to load is a bot-check challenge"""
+        try:
+            return is_challenge_page(await page.title())
+        except Exception:
+            return False
+    
+    async def wait_for_jobs(self, page: Page = None):
+        """Wait for the jobs container to appear on a page"""
+        page = page or self.page
+        
+        # Wait for jobs container to load
+        await page.wait_for_selector(SELECTORS['job_container'], timeout=EXPLICIT_WAIT_TIMEOUT)
+        
+        # Wait until dynamic content settles
+        await self.wait_until_ready(page)
+    
+    async def wait_until_ready(self, page: Page = None, reason: str = "load") -> float:
+        """
+        Wait until the jobs container (with its cards, if any) stops mutating,
+        bounded by READINESS_MAX_WAIT. Returns seconds waited.
+        """
+        page = page or self.page
+        start = time.perf_counter()
+        timed_out = False
+        try:
+            await page.wait_for_function(
+                PAGE_READY_JS,
+                arg={
+                    'containerSelector': SELECTORS['job_container'],
+                    'itemSelector': SELECTORS['job_item'],
+                    'quietMs': READINESS_QUIET_MS,
+                },
+                polling=50,
+                timeout=READINESS_MAX_WAIT
+            )
+        except PlaywrightTimeoutError:
+            timed_out = True
+            self.metrics['readiness_timeouts'] += 1
+        
+        elapsed = time.perf_counter() - start
+        self.metrics['readiness_seconds'] += elapsed
+        self.readiness_log.append({'url': page.url, 'reason': reason, 'seconds': elapsed, 'timed_out': timed_out})
+        return elapsed
+    
+    async def scroll_page(self, page: Page = None):
+        """Scroll page to trigger lazy loading if needed (optimized)"""
+        page = page or self.page
+        try:
+            # Scroll to bottom, wait for any lazy-loaded cards to settle, and scroll back
+            await page.evaluate(SCROLL_TO_BOTTOM_JS)
+            await self.wait_until_ready(page, reason="scroll")
+            await page.evaluate("window.scrollTo(0, 0);")
+        except:
+            pass
+    
+    async def get_job_elements(self, page: Page = None) -> List:
+        """Get all job elements from current page as HTML strings (one browser round-trip)"""
+        page = page or self.page
+        start = time.perf_counter()
+        try:
+            # Serialize every card in a single evaluate call instead of one per ElementHandle
+            job_htmls = await page.eval_on_selector_all(
+                SELECTORS['job_item'],
+                "elements => elements.map(element => element.outerHTML)"
+            )
+            self.metrics['cards_extracted'] += len(job_htmls)
+            return job_htmls
+        except Exception as e:
+            print(f"Error getting job elements: {e}")
+            return []
+        finally:
+            self.metrics['extraction_calls'] += 1
+            self.metrics['extraction_seconds'] += time.perf_counter() - start
+    
+    async def get_job_records(self, page: Page = None) -> List[Dict]:
+        """Get raw field records for all job cards, extracted in-page (one browser round-trip)"""
+        page = page or self.page
+        start = time.perf_counter()
+        try:
+            records = await extract_job_records_async(page)
+            self.metrics['cards_extracted'] += len(records)
+            return records
+        except Exception as e:
+            print(f"Error getting job records: {e}")
+            return []
+        finally:
+            self.metrics['extraction_calls'] += 1
+            self.metrics['extraction_seconds'] += time.perf_counter() - start
+    
+    async def get_job_records_lxml(self, page: Page = None) -> List[Dict]:
+        """Get raw field records for all job cards from one lxml parse of the jobs container"""
+        page = page or self.page
+        start = time.perf_counter()
+        try:
+            container_html = await page.eval_on_selector(SELECTORS['job_container'], "element => element.outerHTML")
+            records = extract_listing_records(parse_listing_tree(container_html), self.parse_cache) or []
+            self.metrics['cards_extracted'] += len(records)
+            return records
+        except Exception as e:
+            print(f"Error getting job records: {e}")
+            return []
+        finally:
+            self.metrics['extraction_calls'] += 1
+            self.metrics['extraction_seconds'] += time.perf_counter() - start
+    
+    async def get_job_cards(self, page: Page = None) -> List:
+        """Get job cards using the configured extraction engine (HTML strings or records)"""
+        if self.extraction_engine == "browser":
+            return await self.get_job_records(page)
+        if self.extraction_engine == "lxml":
+            return await self.get_job_records_lxml(page)
+        return await self.get_job_elements(page)
+    
+    def parse_job_card(self, card) -> Job:
+        """
+        Parse a card returned by get_job_cards.
+        HTML cards, lxml cards (looked up during extraction, see extract_listing_records)
+        and the HTML of records whose extraction failed go through the parse cache.
+        """
+        if isinstance(card, str):
+            return self.parse_html_cached(card)
+        if 'job' in card:
+            self.metrics['parse_cache_hits'] += 1
+            return card['job']
+        if card.get('error'):
+            self.metrics['browser_fallbacks'] += 1
+            print(f"Card extraction failed ({card['error']}), falling back to HTML parser")
+            return self.parse_html_cached(card.get('html') or '')
+        job = parse_job_record(card, self.base_url)
+        if 'cache_key' in card:
+            self.metrics['parse_cache_misses'] += 1
+            self.parse_cache.put_digest(card['cache_key'], job)
+        return job
+    
+    def parse_html_cached(self, html: str) -> Job:
+        """Parse card HTML with the BeautifulSoup parser, through the parse cache"""
+        job = self.parse_cache.get(html)
+        if job is not None:
+            self.metrics['parse_cache_hits'] += 1
+            return job
+        self.metrics['parse_cache_misses'] += 1
+        job = parse_job_element_from_html(html, self.base_url)
+        self.parse_cache.put(html, job)
+        return job
+    
+    async def parse_html_batch(self, job_elements: List) -> Optional[List[Optional[Job]]]:
+        """
+        Parse a large page of card HTML strings up front in the process pool (awaited, so the
+        event loop keeps running while the workers parse).
+        Cached cards are taken from the parse cache; cards skipped as duplicates of
+        another feed are left as None.
+        Returns None for small pages and record cards, which parse_cards handles one by one.
+        """
+        if len(job_elements) < PARSE_POOL_MIN_CARDS or not all(isinstance(card, str) for card in job_elements):
+            return None
+        
+        parsed = [None] * len(job_elements)
+        indexes = []
+        for i, card in enumerate(job_elements):
+            if self.skip_job_ids and self.card_job_id(card) in self.skip_job_ids:
+                continue
+            parsed[i] = self.parse_cache.get(card)
+            if parsed[i] is None:
+                indexes.append(i)
+        self.metrics['parse_cache_hits'] += sum(1 for job in parsed if job is not None)
+        self.metrics['parse_cache_misses'] += len(indexes)
+        
+        for i, job in zip(indexes, await parse_jobs_batch_async([job_elements[i] for i in indexes], self.base_url)):
+            self.parse_cache.put(job_elements[i], job)
+            parsed[i] = job
+        return parsed
+    
+    def card_job_id(self, card) -> str:
+        """Read a card's job ID without parsing it ('' if not found)"""
+        if isinstance(card, dict) and 'job' in card:
+            return card['job'].id or ''
+        if isinstance(card, dict) and not card.get('error'):
+            return extract_job_id_from_url(card.get('href') or '') or ''
+        html = card if isinstance(card, str) else card.get('html') or ''
+        match = JOB_HREF_PATTERN.search(html)
+        return match.group(1) if match else ''
+    
+    def fingerprint_cards(self, job_elements: List) -> Optional[str]:
+        """Hash the ordered list of job IDs on a page without parsing the cards"""
+        job_ids = [self.card_job_id(card) for card in job_elements]
+        
+        if not any(job_ids):
+            return None
+        return hashlib.sha1("\n".join(job_ids).encode('utf-8')).hexdigest()
+    
+    def check_unchanged(self, job_elements: List) -> bool:
+        """
+        Compare the first page's fingerprint with the last processed cycle.
+        Returns True if the listing has not changed (the rest of the cycle can be skipped).
+        """
+        if not SKIP_UNCHANGED_LISTING:
+            return False
+        
+        self.pending_fingerprint = self.fingerprint_cards(job_elements)
+        self.cycle_unchanged = (
+            self.pending_fingerprint is not None
+            and self.pending_fingerprint == self.last_fingerprints.get(self.feed_key)
+        )
+        if self.cycle_unchanged:
+            print("Listing unchanged since last cycle, skipping parse")
+        return self.cycle_unchanged
+    
+    def mark_cycle_processed(self):
+        """Confirm the current cycle's jobs were stored, so an identical listing can be skipped next time"""
+        if self.pending_fingerprint:
+            self.last_fingerprints[self.feed_key] = self.pending_fingerprint
+    
+    async def get_total_pages(self) -> Optional[int]:
+        """Get total number of pages from pagination"""
+        try:
+            pagination = await self.page.query_selector(SELECTORS['pagination'])
+            if not pagination:
+                return 1
+            
+            page_links = await pagination.query_selector_all(SELECTORS['pagination_pages'])
+            
+            if not page_links:
+                return 1
+            
+            # Get the last page number
+            page_numbers = []
+            for link in page_links:
+                try:
+                    text = (await link.inner_text()).strip()
+                    if text.isdigit():
+                        page_numbers.append(int(text))
+                except:
+                    continue
+            
+            return max(page_numbers) if page_numbers else 1
+        except:
+            return 1
+    
+    async def scrape_page(self, existing_job_ids: Set[str] = None, skip_scroll: bool = False,
+                          page: Page = None, first_page: bool = False) -> tuple[List[Job], bool]:
+        """
+        Scrape jobs from current page
+        Returns: (list of job data, should_stop flag)
+        """
+        if existing_job_ids is None:
+            existing_job_ids = set()
+        
+        jobs = []
+        should_stop = False
+        
+        # Scroll only if needed (skip on first page load as it's already loaded)
+        if not skip_scroll:
+            await self.scroll_page(page)
+        
+        # Get job elements
+        job_elements = await self.get_job_cards(page)
+        
+        if not job_elements:
+            print("No job elements found on page")
+            return jobs, should_stop
+        
+        print(f"Found {len(job_elements)} jobs on page")
+        
+        if first_page and self.check_unchanged(job_elements):
+            self.crawl_state['stop_reason'] = "unchanged"
+            return jobs, True
+        
+        return await self.parse_cards(job_elements, existing_job_ids)
+    
+    async def parse_cards(self, job_elements: List, existing_job_ids: Set[str]) -> tuple[List[Job], bool]:
+        """
+        Parse job cards (HTML strings or in-browser records)
+        Returns: (list of job data, should_stop flag)
+        """
+        jobs = []
+        should_stop = False
+        stop_paginating = False
+        parsed = await self.parse_html_batch(job_elements)
+        
+        # Parse each job (HTML strings or in-browser records, depending on the engine)
+        for i, job_card in enumerate(job_elements):
+            try:
+                # Already scraped by another feed this round: don't parse it twice
+                if self.skip_job_ids:
+                    card_id = self.card_job_id(job_card)
+                    if card_id in self.skip_job_ids:
+                        self.metrics['duplicates_skipped'] += 1
+                        self.track_duplicate(card_id)
+                        continue
+                
+                job = parsed[i] if parsed else self.parse_job_card(job_card)
+                
+                # Skip if no ID
+                if not job.id:
+                    continue
+                
+                # Composite key for comparison: id + client_name
+                job_key = job.key
+
+                # Check if we should stop (if STOP_ON_KNOWN_JOB is enabled)
+                if STOP_ON_KNOWN_JOB and job_key in existing_job_ids:
+                    print(f"Found known job {job.id} (client: {job.client_name or 'N/A'}), stopping scrape")
+                    should_stop = True
+                    break
+                
+                jobs.append(job)
+                
+                # Incremental crawl: finish this page, then stop paginating
+                if self.track_incremental(job, job_key in existing_job_ids) and not stop_paginating:
+                    print(f"Passed {self.crawl_state['known_run']} consecutive known jobs, stopping after this page")
+                    stop_paginating = True
+                
+            except Exception as e:
+                print(f"Error parsing job element {i+1}: {e}")
+                continue
+        
+        # Date the page's jobs in one call against one clock reading (cards parsed in pool
+        # workers or served from the parse cache would otherwise each use their own)
+        for job, timestamp in zip(jobs, parse_relative_dates([job.posted_date_relative for job in jobs])):
+            job.posted_date_timestamp = timestamp
+        
+        if should_stop:
+            self.crawl_state['stop_reason'] = "known_job"
+        elif stop_paginating:
+            self.crawl_state['stop_reason'] = "incremental"
+        return jobs, should_stop or stop_paginating
+    
+    async def scrape(self, category: str = None, language: str = None,
+                     existing_job_ids: Set[str] = None, max_pages: int = None,
+                     high_water_mark: Optional[str] = None, concurrent_pages: int = None,
+                     skip_job_ids: Set[str] = None) -> List[Job]:
+        """
+        Scrape jobs from Workana (see scrape_pages for the arguments)
+        Returns list of all scraped jobs
+        """
+        all_jobs = []
+        async for jobs in self.scrape_pages(category, language, existing_job_ids, max_pages,
+                                            high_water_mark, concurrent_pages, skip_job_ids):
+            all_jobs.extend(jobs)
+        return all_jobs
+    
+    async def scrape_pages(self, category: str = None, language: str = None,
+                           existing_job_ids: Set[str] = None, max_pages: int = None,
+                           high_water_mark: Optional[str] = None, concurrent_pages: int = None,
+                           skip_job_ids: Set[str] = None) -> AsyncIterator[List[Job]]:
+        """
+        Scrape jobs from Workana, yielding each page's jobs as soon as it is parsed
+        high_water_mark: newest non-featured job ID from the last cycle (incremental crawl)
+        concurrent_pages: browser pages used for this feed (defaults to the scraper's setting)
+        skip_job_ids: job IDs already scraped by another feed this round (not parsed again)
+        Yields one list of jobs per scraped page (nothing if the listing is unchanged)
+        """
+        if existing_job_ids is None:
+            existing_job_ids = set()
+        
+        if max_pages is None:
+            max_pages = MAX_PAGES
+        
+        if concurrent_pages is None:
+            concurrent_pages = self.concurrent_pages
+        
+        self.reset_metrics()
+        self.feed_key = (category or DEFAULT_CATEGORY, language or DEFAULT_LANGUAGE)
+        self.skip_job_ids = skip_job_ids if skip_job_ids is not None else set()
+        self.cycle_unchanged = False
+        self.pending_fingerprint = None
+        self.reset_crawl_state(high_water_mark)
+        page = 1
+        
+        if self.http_fetcher:
+            async for jobs in self.scrape_http(category, language, existing_job_ids, max_pages):
+                yield jobs
+            return
+        
+        try:
+            # Relaunch here if a recycle failed after closing the browser or context
+            if not await self.ensure_browser():
+                return
+            
+            # Load first page
+            url = self.build_jobs_url(category, language, page)
+            print(f"Loading page {page}: {url}")
+            
+            if not await self.load_page(url):
+                return
+            
+            # Get total pages
+            total_pages = await self.get_total_pages()
+            print(f"Total pages: {total_pages}")
+            
+            if max_pages:
+                total_pages = min(total_pages, max_pages)
+            
+            if concurrent_pages > 1 and total_pages > 1:
+                async for jobs in self.scrape_concurrent(category, language, existing_job_ids, total_pages, concurrent_pages):
+                    yield jobs
+                return
+            
+            if self.pipeline_pages and total_pages > 1:
+                async for jobs in self.scrape_pipelined(category, language, existing_job_ids, total_pages):
+                    yield jobs
+                return
+            
+            # Scrape pages
+            while page <= total_pages:
+                print(f"\nScraping page {page}/{total_pages}")
+                
+                # Scrape current page (skip scroll on first page as it's already loaded)
+                skip_scroll = (page == 1)
+                jobs, should_stop = await self.scrape_page(existing_job_ids, skip_scroll=skip_scroll, first_page=(page == 1))
+                if self.cycle_unchanged:
+                    break
+                
+                print(f"Scraped {len(jobs)} jobs from page {page}")
+                yield jobs
+                
+                # Stop if we found a known job
+                if should_stop:
+                    print(self.stop_message())
+                    break
+                
+                # Move to next page
+                page += 1
+                if page > total_pages:
+                    break
+                
+                # Delay between pages (optimized)
+                delay = self.page_delay()
+                if delay > 0.5:  # Only print if delay is significant
+                    print(f"Waiting {delay:.1f} seconds before next page...")
+                await asyncio.sleep(delay)
+                
+                # Load next page
+                url = self.build_jobs_url(category, language, page)
+                if not await self.load_page(url):
+                    print(f"Failed to load page {page}, stopping")
+                    break
+        
+        except Exception as e:
+            print(f"Error during scraping: {e}")
+    
+    async def fetch_listing_cards(self, url: str) -> Optional[tuple[List, int]]:
+        """
+        Fetch a listing page over HTTP, falling back to the browser when the
+        response lacks the jobs container or job cards.
+        Returns: (job cards, total pages) or None if both paths failed
+        """
+        start = time.perf_counter()
+        listing = await asyncio.to_thread(self.http_fetcher.fetch_listing, url)
+        elapsed = time.perf_counter() - start
+        self.metrics['http_seconds'] += elapsed
+        self.record_load(
+            elapsed,
+            status=self.http_fetcher.last_status,
+            timed_out=self.http_fetcher.last_timed_out,
+            challenged=self.http_fetcher.last_challenge
+        )
+        if listing is not None:
+            self.metrics['pages_http'] += 1
+            return listing
+        
+        self.metrics['http_fallbacks'] += 1
+        print("HTTP response has no job cards, falling back to browser")
+        if not await self.ensure_browser() or not await self.load_page(url):
+            return None
+        return await self.get_job_cards(), await self.get_total_pages()
+    
+    async def scrape_http(self, category: str, language: str,
+                          existing_job_ids: Set[str], max_pages: Optional[int]) -> AsyncIterator[List[Job]]:
+        """
+        Scrape jobs fetching listing pages over HTTP (browser only as fallback)
+        Yields one list of jobs per scraped page
+        """
+        page = 1
+        total_pages = 1
+        
+        try:
+            while page <= total_pages:
+                url = self.build_jobs_url(category, language, page)
+                print(f"Loading page {page}: {url}")
+                
+                listing = await self.fetch_listing_cards(url)
+                if listing is None:
+                    print(f"Failed to load page {page}, stopping")
+                    break
+                job_elements, listing_pages = listing
+                
+                if page == 1:
+                    total_pages = min(listing_pages, max_pages) if max_pages else listing_pages
+                    print(f"Total pages: {total_pages}")
+                
+                print(f"\nScraping page {page}/{total_pages}")
+                print(f"Found {len(job_elements)} jobs on page")
+                if page == 1 and self.check_unchanged(job_elements):
+                    break
+                jobs, should_stop = await self.parse_cards(job_elements, existing_job_ids)
+                
+                print(f"Scraped {len(jobs)} jobs from page {page}")
+                yield jobs
+                
+                if should_stop:
+                    print(self.stop_message())
+                    break
+                
+                page += 1
+                if page > total_pages:
+                    break
+                
+                delay = self.page_delay()
+                if delay > 0.5:  # Only print if delay is significant
+                    print(f"Waiting {delay:.1f} seconds before next page...")
+                await asyncio.sleep(delay)
+        
+        except Exception as e:
+            print(f"Error during scraping: {e}")
+    
+    async def scrape_pipelined(self, category: str, language: str,
+                               existing_job_ids: Set[str], total_pages: int) -> AsyncIterator[List[Job]]:
+        """
+        Scrape pages with the next page loading on a second page object while
+        the current page is parsed (and its jobs are consumed). Page 1 must
+        already be loaded on self.page. Navigation starts are still spaced by page_delay().
+        """
+        pages = await self.get_page_pool(2)
+        current = pages[0]
+        next_allowed = time.time() + self.page_delay()
+        
+        for page_number in range(1, total_pages + 1):
+            print(f"\nScraping page {page_number}/{total_pages}")
+            
+            # Scroll only if needed (skip on first page load as it's already loaded)
+            if page_number > 1:
+                await self.scroll_page(current)
+            job_elements = await self.get_job_cards(current)
+            if page_number == 1 and self.check_unchanged(job_elements):
+                break
+            
+            # Start loading the next page before parsing this one
+            next_page = pages[page_number % 2]
+            next_load = None
+            if page_number < total_pages:
+                wait = next_allowed - time.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                next_url = self.build_jobs_url(category, language, page_number + 1)
+                next_load = asyncio.create_task(self.load_page(next_url, next_page))
+                # Let the task send the navigation before parsing blocks the loop
+                await asyncio.sleep(0)
+                next_allowed = time.time() + self.page_delay()
+            
+            if job_elements:
+                print(f"Found {len(job_elements)} jobs on page")
+            else:
+                print("No job elements found on page")
+            jobs, should_stop = await self.parse_cards(job_elements, existing_job_ids)
+            print(f"Scraped {len(jobs)} jobs from page {page_number}")
+            yield jobs
+            
+            if should_stop:
+                print(self.stop_message())
+                if next_load:
+                    await next_load
+                break
+            
+            if next_load is None:
+                break
+            
+            if not await next_load:
+                print(f"Failed to load page {page_number + 1}, stopping")
+                break
+            current = next_page
+    
+    async def scrape_concurrent(self, category: str, language: str,
+                                existing_job_ids: Set[str], total_pages: int,
+                                concurrent_pages: int = None) -> AsyncIterator[List[Job]]:
+        """
+        Scrape pages using a pool of pages that load in parallel.
+        Page 1 must already be loaded on self.page. Remaining pages are
+        dispatched in waves of `concurrent_pages`, with navigation starts
+        spaced by CONCURRENT_REQUEST_INTERVAL, and results are yielded in page order.
+        """
+        print(f"\nScraping page 1/{total_pages}")
+        jobs, should_stop = await self.scrape_page(existing_job_ids, skip_scroll=True, first_page=True)
+        if self.cycle_unchanged:
+            return
+        print(f"Scraped {len(jobs)} jobs from page 1")
+        yield jobs
+        if should_stop:
+            print(self.stop_message())
+            return
+        
+        pool = await self.get_page_pool(concurrent_pages or self.concurrent_pages)
+        page_numbers = list(range(2, total_pages + 1))
+        
+        for wave_start in range(0, len(page_numbers), len(pool)):
+            wave = list(zip(page_numbers[wave_start:wave_start + len(pool)], pool))
+            print(f"\nLoading pages {wave[0][0]}-{wave[-1][0]} concurrently on {len(wave)} page(s)")
+            
+            # Load the whole wave at once; navigation starts are spaced by the politeness slot
+            loaded = await asyncio.gather(*[
+                self.load_page(self.build_jobs_url(category, language, page_number), page, throttle=True)
+                for page_number, page in wave
+            ])
+            
+            # Collect results in page order
+            for (page_number, page), ok in zip(wave, loaded):
+                if not ok:
+                    print(f"Failed to load page {page_number}, stopping")
+                    return
+                
+                print(f"\nScraping page {page_number}/{total_pages}")
+                jobs, should_stop = await self.scrape_page(existing_job_ids, skip_scroll=False, page=page)
+                print(f"Scraped {len(jobs)} jobs from page {page_number}")
+                yield jobs
+                
+                if should_stop:
+                    print(self.stop_message())
+                    return
+    
+    async def get_browser_memory(self) -> Optional[Dict]:
+        """
+        Get RSS of the browser and its child processes in MB (Chromium on Linux only).
+        Returns dict with browser_mb, renderer_max_mb, total_mb, renderers; None if unavailable.
+        """
+        if not self.browser or BROWSER != "chromium":
+            return None
+        try:
+            cdp = await self.browser.new_browser_cdp_session()
+            try:
+                processes = (await cdp.send('SystemInfo.getProcessInfo'))['processInfo']
+            finally:
+                await cdp.detach()
+        except Exception as e:
+            print(f"⚠️  Could not read browser process info: {e}")
+            return None
+        
+        memory = {'browser_mb': 0.0, 'renderer_max_mb': 0.0, 'total_mb': 0.0, 'renderers': 0}
+        for process in processes:
+            rss_mb = self._read_rss_mb(process['id'])
+            if rss_mb is None:
+                continue
+            memory['total_mb'] += rss_mb
+            if process['type'] == 'browser':
+                memory['browser_mb'] = rss_mb
+            elif process['type'] == 'renderer':
+                memory['renderers'] += 1
+                memory['renderer_max_mb'] = max(memory['renderer_max_mb'], rss_mb)
+        return memory
+    
+    @staticmethod
+    def _read_rss_mb(pid: int) -> Optional[float]:
+        """Read a process's resident set size from /proc (None if not readable)"""
+        try:
+            with open(f"/proc/{pid}/status") as status:
+                for line in status:
+                    if line.startswith('VmRSS:'):
+                        return int(line.split()[1]) / 1024
+        except (OSError, ValueError):
+            pass
+        return None
+    
+    async def check_memory_and_recycle(self) -> Optional[str]:
+        """
+        Recycle the page, context or browser between cycles when a watchdog threshold is crossed.
+        Returns the recycled level ("page", "context", "browser") or None.
+        """
+        if not self.browser_ready():
+            # HTTP mode launches the browser on the next fallback
+            if self.http_fetcher:
+                return None
+            # A recycle failed halfway last cycle: retry the relaunch now
+            print("♻️  Browser, context or page missing, relaunching")
+            return "browser" if await self.ensure_browser() else None
+        
+        memory = await self.get_browser_memory()
+        live_pages = len(self.context.pages) if self.context else 0
+        if memory:
+            print(f"🧠 Browser memory: total {memory['total_mb']:.0f}MB | browser {memory['browser_mb']:.0f}MB | "
+                  f"largest renderer {memory['renderer_max_mb']:.0f}MB ({memory['renderers']} renderers) | "
+                  f"pages {live_pages} | loads in context {self.context_navigations}")
+        
+        level = None
+        reason = None
+        if memory and RECYCLE_BROWSER_TOTAL_MB and memory['total_mb'] > RECYCLE_BROWSER_TOTAL_MB:
+            level, reason = "browser", f"total RSS {memory['total_mb']:.0f}MB > {RECYCLE_BROWSER_TOTAL_MB}MB"
+        elif RECYCLE_CONTEXT_NAVIGATIONS and self.context_navigations >= RECYCLE_CONTEXT_NAVIGATIONS:
+            level, reason = "context", f"{self.context_navigations} page loads >= {RECYCLE_CONTEXT_NAVIGATIONS}"
+        elif memory and RECYCLE_PAGE_RENDERER_MB and memory['renderer_max_mb'] > RECYCLE_PAGE_RENDERER_MB:
+            level, reason = "page", f"renderer RSS {memory['renderer_max_mb']:.0f}MB > {RECYCLE_PAGE_RENDERER_MB}MB"
+        
+        if not level:
+            return None
+        
+        # Disconnecting from a long-lived browser doesn't free its memory: drop the context instead
+        if level == "browser" and self.browser_source == "connected":
+            print(f"♻️  {reason}, but the browser at BROWSER_ENDPOINT is long-lived; "
+                  f"recycling the context instead (restart the browser server to free its memory)")
+            level = "context"
+        
+        # Objects are cleared before they are replaced, so a failure leaves them for ensure_browser to recreate
+        start = time.perf_counter()
+        try:
+            if level == "browser":
+                await self._close_browser()
+                await self.launch_browser()
+            elif level == "context":
+                await self.save_storage_state()
+                context, self.context, self.page, self.page_pool = self.context, None, None, []
+                await context.close()
+                await self._create_context()
+            else:
+                pages, self.page, self.page_pool = [self.page] + self.page_pool, None, []
+                for page in pages:
+                    await page.close()
+                self.page = await self._new_page()
+        except Exception as e:
+            print(f"⚠️  Failed to recycle {level} ({reason}): {e}")
+            print("   Will retry before the next cycle")
+            return None
+        
+        print(f"♻️  Recycled {level} (reason: {reason}) in {time.perf_counter() - start:.2f}s")
+        return level
+    
+    async def _close_browser(self):
+        """Save storage state and close the browser and Playwright"""
+        await self.save_storage_state()
+        if self.browser:
+            # For a connected browser this only drops our contexts and disconnects
+            try:
+                await self.browser.close()
+            except Exception as e:
+                print(f"⚠️  Error closing browser: {e}")
+            self.browser = None
+        if self.playwright:
+            try:
+                await self.playwright.stop()
+            except Exception as e:
+                print(f"⚠️  Error stopping Playwright: {e}")
+            self.playwright = None
+        self.context = None
+        self.page = None
+        self.page_pool = []
+    
+    async def close(self):
+        """Close the browser"""
+        shutdown_parse_pool()
+        self.parse_cache.save()
+        if self.http_fetcher:
+            self.http_fetcher.close()
+            self.http_fetcher = None
+        await self._close_browser()
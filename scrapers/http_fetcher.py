@@ -0,0 +1,113 @@
+"""
+HTTP-only fetcher for Workana listing pages (no browser)
+"""
+from typing import List, Optional, Tuple
+import requests
+from requests.adapters import HTTPAdapter
+from bs4 import BeautifulSoup
+
+from config.settings import USER_AGENT, PAGE_LOAD_TIMEOUT
+from config.selectors import SELECTORS
+from scrapers.rate_limiter import is_challenge_page, page_title
+from parsers import lxml_parser
+
+
+class HttpListingFetcher:
+    """Fetch listing pages over a pooled keep-alive HTTP session"""
+
+    def __init__(self, pool_size: int = 4, extraction_engine: str = "html", parse_cache=None):
+        """
+        Initialize HTTP fetcher
+
+        Args:
+            pool_size: Maximum number of keep-alive connections kept per host
+            extraction_engine: "lxml" returns card records from one lxml parse of the page,
+                anything else returns card HTML strings
+            parse_cache: ParseCache consulted per card by the lxml engine (cached cards skip extraction)
+        """
+        self.extraction_engine = extraction_engine
+        self.parse_cache = parse_cache
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        self.session.headers.update({
+            'User-Agent': USER_AGENT,
+            'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+            'Accept-Language': 'en-US,en;q=0.9,es;q=0.8,pt;q=0.7',
+        })
+        self.timeout = PAGE_LOAD_TIMEOUT / 1000
+        # Outcome of the last fetch (read by the rate limiter)
+        self.last_status = None
+        self.last_timed_out = False
+        self.last_challenge = False
+
+    def fetch_listing(self, url: str) -> Optional[Tuple[List[str], int]]:
+        """
+        Fetch a listing page and split it into job cards
+
+        Args:
+            url: Listing page URL
+
+        Returns:
+            (list of cards, total pages), or None when the response
+            is unusable (error status, no #projects container or no job cards)
+            and the page has to be rendered in the browser instead
+        """
+        self.last_status = None
+        self.last_timed_out = False
+        self.last_challenge = False
+        try:
+            response = self.session.get(url, timeout=self.timeout)
+        except requests.exceptions.Timeout as e:
+            self.last_timed_out = True
+            print(f"HTTP timeout fetching {url}: {e}")
+            return None
+        except requests.exceptions.RequestException as e:
+            print(f"HTTP error fetching {url}: {e}")
+            return None
+
+        self.last_status = response.status_code
+        if response.status_code != 200:
+            self.last_challenge = is_challenge_page(page_title(response.text))
+            print(f"HTTP {response.status_code} fetching {url}")
+            return None
+
+        listing = self.parse_listing(response.text)
+        if listing is None:
+            self.last_challenge = is_challenge_page(page_title(response.text))
+        return listing
+
+    def parse_listing(self, html: str) -> Optional[Tuple[List, int]]:
+        """Split listing HTML into cards (HTML strings or lxml records) and read the total page count"""
+        if self.extraction_engine == "lxml":
+            return lxml_parser.parse_listing(html, self.parse_cache)
+
+        soup = BeautifulSoup(html, 'lxml')
+        container = soup.select_one(SELECTORS['job_container'])
+        if not container:
+            return None
+
+        cards = container.select(SELECTORS['job_item'])
+        if not cards:
+            return None
+
+        return [str(card) for card in cards], self.get_total_pages(soup)
+
+    def get_total_pages(self, soup) -> int:
+        """Get total number of pages from pagination"""
+        pagination = soup.select_one(SELECTORS['pagination'])
+        if not pagination:
+            return 1
+
+        page_numbers = []
+        for link in pagination.select(SELECTORS['pagination_pages']):
+            text = link.get_text(strip=True)
+            if text.isdigit():
+                page_numbers.append(int(text))
+
+        return max(page_numbers) if page_numbers else 1
+
+    def close(self):
+        """Close the HTTP session"""
+        self.session.close()
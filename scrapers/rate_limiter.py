@@ -0,0 +1,99 @@
+"""
+AIMD rate control for listing page loads
+"""
+import re
+import random
+from typing import Optional
+from config.settings import (
+    RATE_MIN_DELAY, RATE_MAX_DELAY, RATE_INCREASE, RATE_DECREASE, RATE_SLOW_LOAD, RATE_JITTER
+)
+
+
+# Status codes that mean the site wants us to slow down
+THROTTLE_STATUS_CODES = {403, 429, 503}
+
+# Text found in the <title> of bot-check / challenge pages instead of the listing
+CHALLENGE_MARKERS = ('Just a moment...', 'Attention Required', 'cf-challenge', 'captcha')
+
+TITLE_PATTERN = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+
+def is_challenge_page(title: Optional[str]) -> bool:
+    """
+    Check if a page title looks like a bot-check challenge.
+    Only the title is checked: normal pages embed reCAPTCHA scripts and forms in the body.
+    """
+    if not title:
+        return False
+    lowered = title.lower()
+    return any(marker.lower() in lowered for marker in CHALLENGE_MARKERS)
+
+
+def page_title(html: Optional[str]) -> Optional[str]:
+    """Text of the <title> element of an HTML document, or None"""
+    match = TITLE_PATTERN.search(html or '')
+    return match.group(1).strip() if match else None
+
+
+class AimdRateLimiter:
+    """
+    Additive-increase / multiplicative-decrease control of the page load rate.
+    Healthy loads add RATE_INCREASE requests/second; timeouts, slow loads,
+    throttling status codes and challenge pages multiply the rate by RATE_DECREASE.
+    The delay between loads is 1 / rate, clamped to RATE_MIN_DELAY..RATE_MAX_DELAY.
+    """
+
+    def __init__(self, initial_delay: float, min_delay: float = None, max_delay: float = None,
+                 increase: float = None, decrease: float = None, slow_seconds: float = None):
+        self.min_delay = min_delay if min_delay is not None else RATE_MIN_DELAY
+        self.max_delay = max_delay if max_delay is not None else RATE_MAX_DELAY
+        self.increase = increase if increase is not None else RATE_INCREASE
+        self.decrease = decrease if decrease is not None else RATE_DECREASE
+        self.slow_seconds = slow_seconds if slow_seconds is not None else RATE_SLOW_LOAD
+        self.rate = 1 / self._clamp(initial_delay)  # Requests per second
+        self.increases = 0
+        self.decreases = 0
+        self.last_backoff_reason = None
+
+    def _clamp(self, delay: float) -> float:
+        return min(max(delay, self.min_delay), self.max_delay)
+
+    @property
+    def delay(self) -> float:
+        """Current delay between page loads in seconds (without jitter)"""
+        return self._clamp(1 / self.rate)
+
+    def next_delay(self) -> float:
+        """Delay before the next page load, with +/- RATE_JITTER relative jitter"""
+        return self.delay * random.uniform(1 - RATE_JITTER, 1 + RATE_JITTER)
+
+    def record(self, seconds: float, status: Optional[int] = None,
+               timed_out: bool = False, challenged: bool = False) -> bool:
+        """
+        Record the outcome of one page load and adjust the rate.
+        Returns True if the rate was cut back.
+        """
+        reason = None
+        if timed_out:
+            reason = "timeout"
+        elif challenged:
+            reason = "challenge page"
+        elif status in THROTTLE_STATUS_CODES:
+            reason = f"HTTP {status}"
+        elif seconds > self.slow_seconds:
+            reason = f"slow load ({seconds:.1f}s)"
+
+        if reason:
+            self.rate = max(self.rate * self.decrease, 1 / self.max_delay)
+            self.decreases += 1
+            self.last_backoff_reason = reason
+            print(f"🐢 Backing off ({reason}): delay between pages now {self.delay:.2f}s")
+            return True
+
+        self.rate = min(self.rate + self.increase, 1 / self.min_delay)
+        self.increases += 1
+        return False
+
+    def describe(self) -> str:
+        """One-line description of the controller state"""
+        return f"delay {self.delay:.2f}s ({self.rate:.2f} req/s, +{self.increases}/-{self.decreases})"
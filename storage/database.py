@@ -2,21 +2,102 @@
 SQLite database manager for Workana job scraping
 """
 import sqlite3
-from datetime import datetime
-from typing import Optional, Dict, List, Set
-import json
+import time
+from datetime import datetime, timedelta
+from typing import Optional, Dict, Iterator, List, Set, Union
 from pathlib import Path
-from config.settings import MAX_JOBS_IN_DB
+from config.settings import (
+    MAX_JOBS_IN_DB, DB_PROFILE, DB_PROFILES, DB_CHECKPOINT_INTERVAL, DB_CHECKPOINT_MODE, KEY_INDEX_MODE
+)
+from parsers.job import Job, JOB_COLUMNS
+from storage.key_index import JobKeyIndex, HashedJobKeyIndex
+
+
+# Job columns refreshed when a known job is seen again
+UPDATED_COLUMNS = (
+    'title', 'description', 'bids_count', 'budget', 'budget_min', 'budget_max',
+    'budget_type', 'skills', 'client_rating', 'client_payment_verified', 'client_last_reply',
+)
+
+# Insert a job, or refresh the UPDATED_COLUMNS and timestamps of a known one (first_seen_at is kept)
+UPSERT_JOB_SQL = f'''
+    INSERT INTO jobs (
+        {', '.join(JOB_COLUMNS)},
+        scraped_at, first_seen_at, last_seen_at
+    ) VALUES ({', '.join('?' * (len(JOB_COLUMNS) + 3))})
+    ON CONFLICT(id) DO UPDATE SET
+        {', '.join(f'{column} = excluded.{column}' for column in UPDATED_COLUMNS)},
+        scraped_at = excluded.scraped_at,
+        last_seen_at = excluded.last_seen_at
+'''
+
+# Maximum number of IDs bound in one "IN (...)" query
+ID_CHUNK_SIZE = 500
+
+# Names of numeric pragma values (for the startup report)
+SYNCHRONOUS_NAMES = {0: 'OFF', 1: 'NORMAL', 2: 'FULL', 3: 'EXTRA'}
+TEMP_STORE_NAMES = {0: 'DEFAULT', 1: 'FILE', 2: 'MEMORY'}
 
 
 class WorkanaDatabase:
     """SQLite database manager for Workana job scraping"""
     
-    def __init__(self, db_path: str = 'workana_jobs.db'):
+    def __init__(self, db_path: str = 'workana_jobs.db', profile: str = None):
         self.db_path = db_path
+        self.profile = profile or DB_PROFILE
         self.conn = sqlite3.connect(db_path)
         self.conn.row_factory = sqlite3.Row  # Access columns by name
+        self.apply_profile(DB_PROFILES[self.profile])
+        self.last_checkpoint = time.monotonic()
         self.create_tables()
+        
+        # Keys of the stored jobs, loaded once and updated on insert/evict
+        index_class = HashedJobKeyIndex if KEY_INDEX_MODE == "hashed" else JobKeyIndex
+        self.job_keys = index_class(self.iter_job_keys())
+    
+    def apply_profile(self, pragmas: Dict):
+        """Apply connection pragmas (see DB_PROFILES)"""
+        for name, value in pragmas.items():
+            self.conn.execute(f'PRAGMA {name} = {value}')
+    
+    def get_profile_settings(self) -> Dict:
+        """Effective connection pragmas, read back from SQLite"""
+        settings = {}
+        for name in ('journal_mode', 'synchronous', 'mmap_size', 'cache_size', 'temp_store', 'busy_timeout'):
+            row = self.conn.execute(f'PRAGMA {name}').fetchone()
+            settings[name] = row[0] if row else 0  # mmap_size has no value for in-memory databases
+        settings['synchronous'] = SYNCHRONOUS_NAMES.get(settings['synchronous'], settings['synchronous'])
+        settings['temp_store'] = TEMP_STORE_NAMES.get(settings['temp_store'], settings['temp_store'])
+        return settings
+    
+    def describe_profile(self) -> str:
+        """One-line description of the connection profile"""
+        settings = self.get_profile_settings()
+        cache_size = settings['cache_size']
+        cache = f"{-cache_size // 1024} MB" if cache_size < 0 else f"{cache_size} pages"
+        return (
+            f"{self.profile} (journal={settings['journal_mode']}, synchronous={settings['synchronous']}, "
+            f"mmap={settings['mmap_size'] // (1024 * 1024)} MB, cache={cache}, "
+            f"temp_store={settings['temp_store']}, busy_timeout={settings['busy_timeout']} ms)"
+        )
+    
+    def checkpoint(self, mode: str = None) -> Optional[tuple]:
+        """
+        Copy the WAL back into the database file (PRAGMA wal_checkpoint).
+        Returns (busy, WAL frames, frames checkpointed), or None when not in WAL mode.
+        """
+        if self.conn.in_transaction:
+            self.conn.commit()
+        self.last_checkpoint = time.monotonic()
+        if self.conn.execute('PRAGMA journal_mode').fetchone()[0] != 'wal':
+            return None
+        return tuple(self.conn.execute(f'PRAGMA wal_checkpoint({mode or DB_CHECKPOINT_MODE})').fetchone())
+    
+    def checkpoint_if_due(self) -> Optional[tuple]:
+        """Checkpoint when DB_CHECKPOINT_INTERVAL seconds have passed since the last one"""
+        if not DB_CHECKPOINT_INTERVAL or time.monotonic() - self.last_checkpoint < DB_CHECKPOINT_INTERVAL:
+            return None
+        return self.checkpoint()
     
     def create_tables(self):
         """Create database tables if they don't exist"""
@@ -86,7 +167,26 @@ class WorkanaDatabase:
                 pages_scraped INTEGER,
                 duration_seconds REAL,
                 category TEXT,
-                language TEXT
+                language TEXT,
+                status TEXT DEFAULT 'completed'
+            )
+        ''')
+        
+        # Add status column to existing databases (migration)
+        try:
+            cursor.execute("ALTER TABLE scrape_history ADD COLUMN status TEXT DEFAULT 'completed'")
+        except sqlite3.OperationalError:
+            pass  # Column already exists
+        
+        # Incremental crawl state (high-water mark per category/language)
+        cursor.execute('''
+            CREATE TABLE IF NOT EXISTS crawl_state (
+                category TEXT NOT NULL,
+                language TEXT NOT NULL,
+                newest_job_id TEXT,
+                newest_position INTEGER,
+                updated_at DATETIME NOT NULL,
+                PRIMARY KEY (category, language)
             )
         ''')
         
@@ -122,126 +222,71 @@ class WorkanaDatabase:
         scraping, so that two jobs are only considered the "same" if both their
         Workana ID and client name match.
         """
-        cursor = self.conn.execute('SELECT id, client_name FROM jobs')
-        keys: Set[str] = set()
-        for row in cursor.fetchall():
-            job_id = row['id'] if isinstance(row, sqlite3.Row) else row[0]
-            client_name = row['client_name'] if isinstance(row, sqlite3.Row) else row[1]
-            key = f"{job_id}|{client_name or ''}"
-            keys.add(key)
-        return keys
+        return set(self.iter_job_keys())
+    
+    def iter_job_keys(self, query: str = 'SELECT id, client_name FROM jobs', params: tuple = ()) -> Iterator[str]:
+        """Yield the "id|client_name" key of each job row returned by query"""
+        for job_id, client_name in self.conn.execute(query, params):
+            yield f"{job_id}|{client_name or ''}"
     
-    def save_job(self, job_data: Dict) -> bool:
+    def find_existing_ids(self, job_ids) -> Set[str]:
+        """Get the subset of job_ids already stored (one query per ID_CHUNK_SIZE IDs)"""
+        job_ids = list(job_ids)
+        existing = set()
+        for i in range(0, len(job_ids), ID_CHUNK_SIZE):
+            chunk = job_ids[i:i + ID_CHUNK_SIZE]
+            cursor = self.conn.execute(
+                f"SELECT id FROM jobs WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+            )
+            existing.update(row[0] for row in cursor)
+        return existing
+    
+    def save_job(self, job: Union[Job, Dict]) -> bool:
         """
         Save or update a job.
         Returns True if job is new, False if it already existed.
         
         If adding a new job would exceed MAX_JOBS_IN_DB, the oldest job
-        (by scraped_at) is removed first to maintain the limit.
+        (by scraped_at) is removed to maintain the limit.
         """
-        now = datetime.now()
-        is_new = not self.job_exists(job_data['id'])
+        if isinstance(job, dict):
+            job = Job.from_dict(job)
+        return job.id in self.save_jobs([job])
+    
+    def save_jobs(self, jobs: List[Union[Job, Dict]]) -> Set[str]:
+        """
+        Save or update many jobs in a single transaction.
+        Returns the IDs of the jobs that were new.
         
-        # Prepare skills as JSON string
-        skills_json = None
-        if job_data.get('skills'):
-            skills_json = json.dumps(job_data['skills']) if isinstance(job_data['skills'], list) else job_data['skills']
+        Known jobs are detected with one lookup before the upsert, and the
+        MAX_JOBS_IN_DB limit is enforced once after all jobs are written
+        (oldest jobs by scraped_at are removed).
+        """
+        jobs = [Job.from_dict(job) if isinstance(job, dict) else job for job in jobs]
+        jobs = [job for job in jobs if job.id]
+        if not jobs:
+            return set()
         
-        if is_new:
-            # Check if we need to remove oldest job to maintain limit
-            cursor = self.conn.execute('SELECT COUNT(*) FROM jobs')
-            current_count = cursor.fetchone()[0]
-            
-            if current_count >= MAX_JOBS_IN_DB:
-                # Remove the oldest job (by scraped_at)
-                cursor = self.conn.execute('''
-                    SELECT id FROM jobs 
-                    ORDER BY scraped_at ASC 
-                    LIMIT 1
-                ''')
-                oldest_job = cursor.fetchone()
-                if oldest_job:
-                    oldest_job_id = oldest_job[0]
-                    self.conn.execute('DELETE FROM jobs WHERE id = ?', (oldest_job_id,))
-                    print(f"🗑️  Removed oldest job (ID: {oldest_job_id}) to maintain database limit of {MAX_JOBS_IN_DB}")
-            
-            # Insert new job
-            self.conn.execute('''
-                INSERT INTO jobs (
-                    id, title, description, url, posted_date_relative,
-                    posted_date_timestamp, bids_count, budget, budget_min,
-                    budget_max, budget_type, skills, client_name,
-                    client_country, client_rating, client_payment_verified,
-                    client_last_reply, is_featured, is_max_project,
-                    scraped_at, first_seen_at, last_seen_at,
-                    sent_to_slack, slack_sent_at,
-                    exported_to_sheets, sheets_exported_at
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                job_data.get('id'),
-                job_data.get('title'),
-                job_data.get('description'),
-                job_data.get('url'),
-                job_data.get('posted_date_relative'),
-                job_data.get('posted_date_timestamp'),
-                job_data.get('bids_count'),
-                job_data.get('budget'),
-                job_data.get('budget_min'),
-                job_data.get('budget_max'),
-                job_data.get('budget_type'),
-                skills_json,
-                job_data.get('client_name'),
-                job_data.get('client_country'),
-                job_data.get('client_rating'),
-                job_data.get('client_payment_verified', False),
-                job_data.get('client_last_reply'),
-                job_data.get('is_featured', False),
-                job_data.get('is_max_project', False),
-                now,
-                now,
-                now,
-                0,  # sent_to_slack = False for new jobs
-                None,  # slack_sent_at = None
-                0,  # exported_to_sheets = False for new jobs
-                None  # sheets_exported_at = None
-            ))
-        else:
-            # Update existing job
-            self.conn.execute('''
-                UPDATE jobs SET
-                    title = ?,
-                    description = ?,
-                    bids_count = ?,
-                    budget = ?,
-                    budget_min = ?,
-                    budget_max = ?,
-                    budget_type = ?,
-                    skills = ?,
-                    client_rating = ?,
-                    client_payment_verified = ?,
-                    client_last_reply = ?,
-                    scraped_at = ?,
-                    last_seen_at = ?
-                WHERE id = ?
-            ''', (
-                job_data.get('title'),
-                job_data.get('description'),
-                job_data.get('bids_count'),
-                job_data.get('budget'),
-                job_data.get('budget_min'),
-                job_data.get('budget_max'),
-                job_data.get('budget_type'),
-                skills_json,
-                job_data.get('client_rating'),
-                job_data.get('client_payment_verified', False),
-                job_data.get('client_last_reply'),
-                now,
-                now,
-                job_data.get('id')
-            ))
+        job_ids = {job.id for job in jobs}
+        new_ids = job_ids - self.find_existing_ids(job_ids)
         
-        self.conn.commit()
-        return is_new
+        now = datetime.now()
+        with self.conn:
+            self.conn.executemany(UPSERT_JOB_SQL, [job.to_row() + (now, now, now) for job in jobs])
+            removed_keys = self._remove_oldest_jobs(MAX_JOBS_IN_DB)
+        
+        # The first row of a new ID is the one inserted (client_name is not updated)
+        new_keys = {}
+        for job in jobs:
+            if job.id in new_ids:
+                new_keys.setdefault(job.id, job.key)
+        self.job_keys.update(new_keys.values())
+        for key in removed_keys:
+            self.job_keys.discard(key)
+        
+        if removed_keys:
+            print(f"🗑️  Removed {len(removed_keys)} oldest job(s) to maintain database limit of {MAX_JOBS_IN_DB}")
+        return new_ids
     
     def mark_job_sent_to_slack(self, job_id: str) -> bool:
         """
@@ -297,6 +342,58 @@ class WorkanaDatabase:
             return bool(row[0])
         return False
     
+    def get_jobs_not_sent_to_slack(self, job_ids) -> Set[str]:
+        """Get the subset of job_ids not yet sent to Slack (one query per ID_CHUNK_SIZE IDs)"""
+        return self._get_undelivered_ids(job_ids, 'sent_to_slack')
+    
+    def mark_jobs_sent_to_slack(self, job_ids) -> int:
+        """
+        Mark many jobs as sent to Slack in one transaction.
+        Returns the number of jobs marked (already sent or unknown IDs are not counted).
+        """
+        return self._mark_delivered(job_ids, 'sent_to_slack', 'slack_sent_at')
+    
+    def get_jobs_not_exported_to_sheets(self, job_ids) -> Set[str]:
+        """Get the subset of job_ids not yet exported to Google Sheets (one query per ID_CHUNK_SIZE IDs)"""
+        return self._get_undelivered_ids(job_ids, 'exported_to_sheets')
+    
+    def mark_jobs_exported_to_sheets(self, job_ids) -> int:
+        """
+        Mark many jobs as exported to Google Sheets in one transaction.
+        Returns the number of jobs marked (already exported or unknown IDs are not counted).
+        """
+        return self._mark_delivered(job_ids, 'exported_to_sheets', 'sheets_exported_at')
+    
+    def _get_undelivered_ids(self, job_ids, flag_column: str) -> Set[str]:
+        """IDs in job_ids whose flag_column is not set (unknown IDs count as undelivered)"""
+        job_ids = list(dict.fromkeys(job_ids))
+        delivered = set()
+        for i in range(0, len(job_ids), ID_CHUNK_SIZE):
+            chunk = job_ids[i:i + ID_CHUNK_SIZE]
+            cursor = self.conn.execute(
+                f"SELECT id FROM jobs WHERE id IN ({', '.join('?' * len(chunk))}) AND {flag_column} = 1", chunk
+            )
+            delivered.update(row[0] for row in cursor)
+        return set(job_ids) - delivered
+    
+    def _mark_delivered(self, job_ids, flag_column: str, time_column: str) -> int:
+        """Set flag_column and time_column for the undelivered jobs in job_ids, in one transaction"""
+        job_ids = list(dict.fromkeys(job_ids))
+        if not job_ids:
+            return 0
+        now = datetime.now()
+        marked_count = 0
+        with self.conn:
+            for i in range(0, len(job_ids), ID_CHUNK_SIZE):
+                chunk = job_ids[i:i + ID_CHUNK_SIZE]
+                cursor = self.conn.execute(f'''
+                    UPDATE jobs 
+                    SET {flag_column} = 1, {time_column} = ?
+                    WHERE id IN ({', '.join('?' * len(chunk))}) AND {flag_column} = 0
+                ''', [now] + chunk)
+                marked_count += cursor.rowcount
+        return marked_count
+    
     def get_jobs_for_today(self) -> List[Dict]:
         """
         Get all jobs that were first seen today (for daily sheet export).
@@ -341,15 +438,65 @@ class WorkanaDatabase:
     
     def save_scrape_history(self, jobs_found: int, new_jobs_count: int, 
                            pages_scraped: int, duration_seconds: float,
-                           category: str = None, language: str = None):
-        """Record scraping session statistics"""
+                           category: str = None, language: str = None, status: str = 'completed'):
+        """
+        Record scraping session statistics.
+        status is 'completed' for full cycles or 'unchanged' when the listing was skipped.
+        """
         self.conn.execute('''
             INSERT INTO scrape_history 
-            (timestamp, jobs_found, new_jobs_count, pages_scraped, duration_seconds, category, language)
-            VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (datetime.now(), jobs_found, new_jobs_count, pages_scraped, duration_seconds, category, language))
+            (timestamp, jobs_found, new_jobs_count, pages_scraped, duration_seconds, category, language, status)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        ''', (datetime.now(), jobs_found, new_jobs_count, pages_scraped, duration_seconds, category, language, status))
+        self.conn.commit()
+    
+    def get_high_water_mark(self, category: str, language: str) -> Optional[Dict]:
+        """
+        Get the incremental crawl high-water mark for a category/language.
+        Returns dict with newest_job_id and newest_position, or None if not crawled yet.
+        """
+        cursor = self.conn.execute(
+            'SELECT newest_job_id, newest_position FROM crawl_state WHERE category = ? AND language = ?',
+            (category, language)
+        )
+        row = cursor.fetchone()
+        return dict(row) if row else None
+    
+    def save_high_water_mark(self, category: str, language: str, job_id: str, position: int):
+        """Store the newest non-featured job seen for a category/language"""
+        self.conn.execute('''
+            INSERT INTO crawl_state (category, language, newest_job_id, newest_position, updated_at)
+            VALUES (?, ?, ?, ?, ?)
+            ON CONFLICT(category, language) DO UPDATE SET
+                newest_job_id = excluded.newest_job_id,
+                newest_position = excluded.newest_position,
+                updated_at = excluded.updated_at
+        ''', (category, language, job_id, position, datetime.now()))
         self.conn.commit()
     
+    def get_hourly_arrival_rates(self, category: str = None, language: str = None, days: int = 14) -> Dict[int, float]:
+        """
+        Get the observed rate of new jobs (per hour) for each hour of day over the last `days` days.
+        The rate is the number of new jobs divided by the number of distinct clock hours that had
+        at least one scrape, so hours that were never polled are missing from the result.
+        """
+        since = datetime.now() - timedelta(days=days)
+        cursor = self.conn.execute('''
+            SELECT CAST(strftime('%H', timestamp) AS INTEGER) AS hour,
+                   SUM(new_jobs_count) AS new_jobs,
+                   COUNT(DISTINCT strftime('%Y-%m-%d %H', timestamp)) AS hours_observed
+            FROM scrape_history
+            WHERE timestamp > ?
+              AND (? IS NULL OR category = ?)
+              AND (? IS NULL OR language = ?)
+            GROUP BY hour
+        ''', (since, category, category, language, language))
+        return {
+            row['hour']: (row['new_jobs'] or 0) / row['hours_observed']
+            for row in cursor.fetchall()
+            if row['hours_observed']
+        }
+    
     def get_last_scrape_time(self) -> Optional[datetime]:
         """Get timestamp of last scrape"""
         cursor = self.conn.execute(
@@ -397,30 +544,35 @@ class WorkanaDatabase:
         if keep_count is None:
             keep_count = MAX_JOBS_IN_DB
         
+        removed_keys = self._remove_oldest_jobs(keep_count)
+        self.conn.commit()
+        for key in removed_keys:
+            self.job_keys.discard(key)
+        
+        return len(removed_keys)
+    
+    def _remove_oldest_jobs(self, keep_count: int) -> List[str]:
+        """
+        Delete the oldest jobs (by scraped_at) beyond keep_count, without committing
+        Returns the keys of the removed jobs
+        """
         # Get current count
         cursor = self.conn.execute('SELECT COUNT(*) FROM jobs')
         current_count = cursor.fetchone()[0]
         
         if current_count <= keep_count:
-            return 0  # No cleanup needed
+            return []  # No cleanup needed
         
         # Calculate how many to remove
         remove_count = current_count - keep_count
         
         # Delete oldest jobs (by scraped_at)
-        cursor = self.conn.execute('''
-            DELETE FROM jobs 
-            WHERE id IN (
-                SELECT id FROM jobs 
-                ORDER BY scraped_at ASC 
-                LIMIT ?
-            )
-        ''', (remove_count,))
-        
-        deleted_count = cursor.rowcount
-        self.conn.commit()
+        rows = self.conn.execute(
+            'SELECT id, client_name FROM jobs ORDER BY scraped_at ASC LIMIT ?', (remove_count,)
+        ).fetchall()
+        self.conn.executemany('DELETE FROM jobs WHERE id = ?', [(job_id,) for job_id, _ in rows])
         
-        return deleted_count
+        return [f"{job_id}|{client_name or ''}" for job_id, client_name in rows]
     
     def close(self):
         """Close database connection"""
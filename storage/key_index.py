@@ -0,0 +1,106 @@
+"""
+In-process index of the job keys stored in the database
+"""
+from array import array
+from bisect import bisect_left
+from typing import Iterable
+
+
+class JobKeyIndex:
+    """
+    Set of stored job keys ("id|client_name", see Job.key) that is loaded
+    once and then kept in step with inserts and evictions, so known-job
+    checks are O(1) lookups instead of a table scan per cycle.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self.entries = set(keys)
+
+    def add(self, key: str):
+        self.entries.add(key)
+
+    def update(self, keys: Iterable[str]):
+        self.entries.update(keys)
+
+    def discard(self, key: str):
+        self.entries.discard(key)
+
+    def clear(self):
+        self.entries.clear()
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+class HashedJobKeyIndex:
+    """
+    Compact JobKeyIndex for large MAX_JOBS_IN_DB limits: 64-bit key hashes
+    in a sorted array('Q') (8 bytes per key), searched with bisect.
+    Inserts and deletions since the last rebuild are kept in two small sets
+    and merged into the array once they grow past a fraction of it.
+    A hash collision makes a new job look known, which is negligible with
+    64-bit hashes at any retention limit the table can hold.
+    """
+
+    def __init__(self, keys: Iterable[str] = ()):
+        self.hashes = array('Q', sorted({self._hash(key) for key in keys}))
+        self.added = set()  # Hashes not in self.hashes yet
+        self.removed = set()  # Hashes in self.hashes that were deleted
+
+    @staticmethod
+    def _hash(key: str) -> int:
+        # str hashes are 64-bit and salted per process, which is fine for an in-process index
+        return hash(key) & 0xFFFFFFFFFFFFFFFF
+
+    def _in_array(self, value: int) -> bool:
+        i = bisect_left(self.hashes, value)
+        return i < len(self.hashes) and self.hashes[i] == value
+
+    def _compact_if_needed(self):
+        """Merge pending inserts/deletions into the sorted array once they are ~1/16 of it"""
+        if len(self.added) + len(self.removed) <= max(1024, len(self.hashes) // 16):
+            return
+        removed = self.removed
+        merged = [value for value in self.hashes if value not in removed]
+        merged.extend(self.added)
+        merged.sort()
+        self.hashes = array('Q', merged)
+        self.added = set()
+        self.removed = set()
+
+    def add(self, key: str):
+        value = self._hash(key)
+        if value in self.removed:
+            self.removed.discard(value)
+        elif not self._in_array(value):
+            self.added.add(value)
+            self._compact_if_needed()
+
+    def update(self, keys: Iterable[str]):
+        for key in keys:
+            self.add(key)
+
+    def discard(self, key: str):
+        value = self._hash(key)
+        if value in self.added:
+            self.added.discard(value)
+        elif value not in self.removed and self._in_array(value):
+            self.removed.add(value)
+            self._compact_if_needed()
+
+    def clear(self):
+        self.hashes = array('Q')
+        self.added = set()
+        self.removed = set()
+
+    def __contains__(self, key: str) -> bool:
+        value = self._hash(key)
+        if value in self.added:
+            return True
+        return value not in self.removed and self._in_array(value)
+
+    def __len__(self) -> int:
+        return len(self.hashes) - len(self.removed) + len(self.added)
@@ -0,0 +1,113 @@
+"""
+Fixed-rate scheduler with an interval adapted to the observed job arrival rate
+"""
+import math
+import time
+from datetime import datetime
+from typing import Dict
+from config.settings import (
+    SCRAPE_INTERVAL, SCHEDULE_MIN_INTERVAL, SCHEDULE_MAX_INTERVAL,
+    SCHEDULE_TARGET_NEW_JOBS, SCHEDULE_OVERRUN
+)
+
+
+class FeedScheduler:
+    """
+    Schedule runs of one feed on a fixed-rate timeline.
+    Each run is due one interval after the previous *scheduled* time (not after
+    the run finished), so cycle duration does not make the period drift.
+    """
+
+    def __init__(self, interval: float = None, adaptive: bool = True,
+                 min_interval: float = None, max_interval: float = None,
+                 target_new_jobs: float = None, overrun: str = None):
+        """
+        Initialize scheduler
+
+        Args:
+            interval: Base interval in seconds (used as is when not adaptive, or when there is no history)
+            adaptive: Adapt the interval to the arrival rate of new jobs for the current hour
+            min_interval: Shortest adaptive interval in seconds
+            max_interval: Longest adaptive interval in seconds
+            target_new_jobs: Expected number of new jobs per run the adaptive interval aims for
+            overrun: "skip" to drop ticks missed by a long run, "catch_up" to run them back to back
+        """
+        self.base_interval = interval or SCRAPE_INTERVAL
+        self.adaptive = adaptive
+        self.min_interval = min_interval or SCHEDULE_MIN_INTERVAL
+        self.max_interval = max_interval or SCHEDULE_MAX_INTERVAL
+        self.target_new_jobs = target_new_jobs or SCHEDULE_TARGET_NEW_JOBS
+        self.overrun = overrun or SCHEDULE_OVERRUN
+        self.interval = self.base_interval
+        self.arrival_rate = None  # New jobs per hour used for the current interval
+        self.next_run = time.monotonic()  # First run is due immediately
+        self.skipped_runs = 0
+
+    def seconds_until_due(self) -> float:
+        """Seconds until the next run is due (0 if already due)"""
+        return max(self.next_run - time.monotonic(), 0.0)
+
+    def is_due(self) -> bool:
+        """Check if the next run is due"""
+        return time.monotonic() >= self.next_run
+
+    def next_run_datetime(self) -> datetime:
+        """Wall-clock time of the next run"""
+        return datetime.fromtimestamp(time.time() + self.seconds_until_due())
+
+    def update_interval(self, hourly_rates: Dict[int, float], hour: int = None) -> float:
+        """
+        Recompute the interval from observed new jobs per hour, by hour of day.
+        Uses the rate for `hour` (default: now), or the average of all observed
+        hours if that hour has no history. Returns the interval in seconds.
+        """
+        if not self.adaptive:
+            self.interval = self.base_interval
+            return self.interval
+
+        if hour is None:
+            hour = datetime.now().hour
+
+        rate = hourly_rates.get(hour)
+        if rate is None and hourly_rates:
+            rate = sum(hourly_rates.values()) / len(hourly_rates)
+        self.arrival_rate = rate
+
+        if rate is None:
+            # No history yet
+            interval = self.base_interval
+        elif rate <= 0:
+            interval = self.max_interval
+        else:
+            # Poll often enough to expect target_new_jobs new jobs per run
+            interval = self.target_new_jobs / rate * 3600
+
+        self.interval = min(max(interval, self.min_interval), self.max_interval)
+        return self.interval
+
+    def advance(self) -> int:
+        """
+        Move the timeline to the next tick after a run.
+        Returns the number of ticks skipped because the run overran them.
+        """
+        self.next_run += self.interval
+        now = time.monotonic()
+        if self.next_run > now:
+            return 0
+
+        missed = math.floor((now - self.next_run) / self.interval) + 1
+        if self.overrun == "catch_up":
+            # Keep the missed ticks on the timeline: they run back to back until caught up
+            print(f"⚠️  Run overran the schedule by {missed} tick(s), catching up")
+            return 0
+
+        self.next_run += missed * self.interval
+        self.skipped_runs += missed
+        print(f"⚠️  Run overran the schedule, skipped {missed} tick(s)")
+        return missed
+
+    def describe(self) -> str:
+        """One-line description of the current schedule"""
+        rate = f"{self.arrival_rate:.1f} new jobs/h" if self.arrival_rate is not None else "no history"
+        mode = "adaptive" if self.adaptive else "fixed"
+        return f"every {self.interval:.0f}s ({mode}, {rate})"
@@ -526,7 +526,7 @@ class SheetsExporter:
             print(f"  Translating {len(jobs)} job(s) before export...")
             for i, job in enumerate(jobs, 1):
                 try:
-                    translated_job = self.translator.translate_job_data(job.copy())
+                    translated_job = self.translator.translate_job_data(job)
                     translated_jobs.append(translated_job)
                     if len(jobs) > 10 and i % 10 == 0:
                         print(f"    Translated {i}/{len(jobs)} jobs...")